@@ -0,0 +1,28 @@
+"""
+Freeze the preset table into a binary cache
+
+Writes the structured preset table to presets.npy next to this module so
+interpreter start-up can mmap the ready-made array instead of rebuilding
+it from the Python literal. The .npy file is a generated artifact; rerun
+this tool after editing the presets.
+
+Usage:
+    python -m epidemic_sim.config.freeze_presets
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from epidemic_sim.config import presets
+
+
+def main():
+    """Write the structured preset table to presets.npy."""
+    out = Path(__file__).with_name('presets.npy')
+    np.save(out, np.asarray(presets._PRESET_TABLE))
+    print(f"Wrote {len(presets.PRESETS)} presets to {out}")
+
+
+if __name__ == '__main__':
+    main()
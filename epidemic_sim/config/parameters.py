@@ -2,65 +2,448 @@
 Simulation parameters configuration
 Contains SimParams class with all configurable simulation parameters
 """
+import json
+import logging
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+# Module logger - unlike print(), costs nothing for users who don't
+# configure logging and never stalls hot paths on stdout flushes
+log = logging.getLogger(__name__)
+
+# orjson encodes/decodes in C and is several times faster than stdlib json;
+# fall back silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fastjsonschema compiles the schema to specialized Python once, replacing
+# the per-field range branches of validate() on the load path
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+_schema_validator = None
+
+
+def _get_schema_validator():
+    """Compile (once) a JSON-schema validator derived from SimParams._BOUNDS."""
+    global _schema_validator
+    if _schema_validator is None and fastjsonschema is not None:
+        properties = {
+            name: {'type': 'number', 'minimum': lo, 'maximum': hi}
+            for name, lo, hi in SimParams._BOUNDS
+        }
+        _schema_validator = fastjsonschema.compile(
+            {'type': 'object', 'properties': properties}
+        )
+    return _schema_validator
+
+
+class SimSnapshot(NamedTuple):
+    """
+    Immutable copy of the hot-loop parameters plus derived quantities.
+
+    The simulation step reads parameters thousands of times per timestep;
+    taking a snapshot once per step replaces repeated global + attribute
+    lookups on the mutable params object with cheap NamedTuple access, and
+    pre-computes values (squared radius, per-step probability) that would
+    otherwise be recalculated per particle pair.
+    """
+    infection_radius: float
+    infection_radius_sq: float
+    prob_infection: float
+    per_step_infection_prob: float
+    prob_no_symptoms: float
+    boxes_to_consider: int
+    speed_limit: float
+    boundary_force: float
+    social_distance_factor: float
+    social_distance_obedient: float
+    time_steps_per_day: int
+    infection_duration: int
+    mortality_rate: float
+    quarantine_enabled: bool
+    quarantine_after: int
+    quarantine_duration: int
+    start_quarantine: int
+
+
+def _make_range_check(lo, hi):
+    """Build a range predicate with lo/hi bound at compile time."""
+    return lambda v: lo <= v <= hi
+
+
+# Default value for every parameter - single source of truth shared by
+# __init__ and reset(). Applied in one loop instead of 30 attribute stores.
+_DEFAULTS = {
+    # Infection parameters (BETTER DEFAULTS)
+    'infection_radius': 0.15,
+    'prob_infection': 0.15,  # Increased significantly for visible spread (15% per contact)
+    'fraction_infected_init': 0.01,
+    'infection_duration': 25,
+
+    # Social distancing
+    'social_distance_factor': 0.0,
+    'social_distance_obedient': 1.0,
+    'boxes_to_consider': 2,
+
+    # Particle physics
+    'num_particles': 200,
+    'particle_size': 6,
+    'speed_limit': 0.1,
+    'boundary_force': 0.2,
+    'time_steps_per_day': 24,
+
+    # Quarantine parameters (LESS AGGRESSIVE)
+    'quarantine_enabled': False,  # Toggle quarantine on/off
+    'quarantine_after': 5,  # Quarantine earlier (5 days)
+    'start_quarantine': 10,  # But start later (day 10)
+    'quarantine_duration': 14,  # Days to stay in quarantine (0 = until recovered)
+    'prob_no_symptoms': 0.20,  # 20% asymptomatic (more realistic)
+
+    # Mortality (SEIRD-ready)
+    'mortality_rate': 0.0,  # 0-1 (0% to 100%)
+
+    # Communities
+    'travel_probability': 0.02,
+    'num_per_community': 60,
+    'communities_to_infect': 2,
+
+    # Marketplace gathering parameters (REALISTIC SETTINGS)
+    'marketplace_enabled': False,
+    'marketplace_interval': 1,  # Daily marketplace availability
+    'marketplace_duration': 50,  # Time steps particles stay (realistic shopping/work time)
+    'marketplace_attendance': 0.08,  # 8% attend daily (realistic trickle, not mass gathering)
+    'marketplace_x': 0.0,  # Center location (simple/quarantine mode)
+    'marketplace_y': 0.0,
+    'marketplace_community_id': 4,  # Center tile in 3x3 grid (communities mode)
+
+    # Visualization options
+    'show_infection_radius': False,  # Toggle infection radius visualization
+}
+
+
+# POD struct layout matching _DEFAULTS field order and Python types, so C
+# extensions can receive the whole parameter set as one typed record
+_DTYPE = np.dtype([
+    (name, '?' if isinstance(value, bool)
+     else 'i4' if isinstance(value, int)
+     else 'f8')
+    for name, value in _DEFAULTS.items()
+])
 
 
 class SimParams:
     """
-    Global parameters object for epidemic simulation
-
-    Contains all configurable parameters for:
-    - Infection dynamics
-    - Population behavior
-    - Quarantine rules
-    - Mortality rates
-    - Community and marketplace settings
+    Global parameters object for epidemic simulation.
+
+    Holds every configurable parameter (infection dynamics, behavior,
+    quarantine, mortality, communities, marketplace); see _DEFAULTS for the
+    full annotated list. Uses __slots__ so attribute reads in the hot loops
+    skip the per-instance __dict__ lookup.
     """
 
+    # Single declarative list of all parameter fields - drives __slots__,
+    # serialization, and anything else that needs to enumerate parameters
+    _FIELDS = (
+        'infection_radius', 'prob_infection', 'fraction_infected_init',
+        'infection_duration',
+        'social_distance_factor', 'social_distance_obedient', 'boxes_to_consider',
+        'num_particles', 'particle_size', 'speed_limit', 'boundary_force',
+        'time_steps_per_day',
+        'quarantine_enabled', 'quarantine_after', 'start_quarantine',
+        'quarantine_duration', 'prob_no_symptoms',
+        'mortality_rate',
+        'travel_probability', 'num_per_community', 'communities_to_infect',
+        'marketplace_enabled', 'marketplace_interval', 'marketplace_duration',
+        'marketplace_attendance', 'marketplace_x', 'marketplace_y',
+        'marketplace_community_id',
+        'show_infection_radius',
+    )
+
+    __slots__ = _FIELDS + ('_r0_cache', '_snapshot_cache', '_infection_radius_sq',
+                           '_array_cache', '_struct_cache')
+
+    # Position of each field inside the as_array() vector, so compiled
+    # kernels can index parameters by constant instead of by name
+    FIELD_INDEX = {name: i for i, name in enumerate(_FIELDS)}
+
+    # Fields that feed into the R0 estimate - writing any of them
+    # invalidates the cached value
+    _R0_FIELDS = frozenset((
+        'infection_radius', 'prob_infection', 'infection_duration',
+        'num_particles', 'social_distance_factor', 'social_distance_obedient',
+    ))
+
+    # Valid (lo, hi) range per numeric field - one table instead of a
+    # hand-written branch per parameter. Ranges mirror the UI slider limits.
+    _BOUNDS = (
+        ('infection_radius', 0.01, 0.4),
+        ('prob_infection', 0.0, 1.0),
+        ('fraction_infected_init', 0.0, 0.05),
+        ('infection_duration', 1, 100),
+        ('social_distance_factor', 0.0, 2.0),
+        ('social_distance_obedient', 0.0, 1.0),
+        ('boxes_to_consider', 1, 10),
+        ('num_particles', 50, 2000),
+        ('particle_size', 1, 20),
+        ('speed_limit', 0.01, 1.0),
+        ('boundary_force', 0.0, 1.0),
+        ('time_steps_per_day', 1, 100),
+        ('quarantine_after', 1, 20),
+        ('start_quarantine', 0, 30),
+        ('quarantine_duration', 0, 50),
+        ('prob_no_symptoms', 0.0, 0.5),
+        ('mortality_rate', 0.0, 1.0),
+        ('travel_probability', 0.0, 1.0),
+        ('num_per_community', 20, 200),
+        ('communities_to_infect', 1, 9),
+        ('marketplace_interval', 1, 30),
+        ('marketplace_duration', 1, 100),
+        ('marketplace_attendance', 0.0, 1.0),
+        ('marketplace_x', -1.0, 1.0),
+        ('marketplace_y', -1.0, 1.0),
+        ('marketplace_community_id', 0, 8),
+    )
+
+    # Predicates compiled once from _BOUNDS at class-creation time, so
+    # validate() runs one tight loop of prebuilt closures instead of
+    # re-deriving bounds per call
+    _CHECKS = tuple(
+        (name, _make_range_check(lo, hi), f"{lo}-{hi}")
+        for name, lo, hi in _BOUNDS
+    )
+
     def __init__(self):
-        # Infection parameters (BETTER DEFAULTS)
-        self.infection_radius = 0.15
-        self.prob_infection = 0.15  # Increased significantly for visible spread (15% per contact)
-        self.fraction_infected_init = 0.01
-        self.infection_duration = 25
-
-        # Social distancing
-        self.social_distance_factor = 0.0
-        self.social_distance_obedient = 1.0
-        self.boxes_to_consider = 2
-
-        # Particle physics
-        self.num_particles = 200
-        self.particle_size = 6
-        self.speed_limit = 0.1
-        self.boundary_force = 0.2
-        self.time_steps_per_day = 24
-
-        # Quarantine parameters (LESS AGGRESSIVE)
-        self.quarantine_enabled = False  # Toggle quarantine on/off
-        self.quarantine_after = 5  # Quarantine earlier (5 days)
-        self.start_quarantine = 10   # But start later (day 10)
-        self.quarantine_duration = 14  # Days to stay in quarantine (0 = until recovered)
-        self.prob_no_symptoms = 0.20  # 20% asymptomatic (more realistic)
-
-        # Mortality (SEIRD-ready)
-        self.mortality_rate = 0.0  # 0-1 (0% to 100%)
-
-        # Communities
-        self.travel_probability = 0.02
-        self.num_per_community = 60
-        self.communities_to_infect = 2
-
-        # Marketplace gathering parameters (REALISTIC SETTINGS)
-        self.marketplace_enabled = False
-        self.marketplace_interval = 1  # Daily marketplace availability
-        self.marketplace_duration = 50  # Time steps particles stay (realistic shopping/work time)
-        self.marketplace_attendance = 0.08  # 8% attend daily (realistic trickle, not mass gathering)
-        self.marketplace_x = 0.0  # Center location (simple/quarantine mode)
-        self.marketplace_y = 0.0
-        self.marketplace_community_id = 4  # Center tile in 3x3 grid (communities mode)
-
-        # Visualization options
-        self.show_infection_radius = False  # Toggle infection radius visualization
+        object.__setattr__(self, '_r0_cache', None)
+        object.__setattr__(self, '_snapshot_cache', None)
+
+        # One C-level loop over _DEFAULTS instead of 30 attribute stores;
+        # object.__setattr__ skips the cache-invalidation hook (caches are
+        # already empty at this point)
+        for name, value in _DEFAULTS.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_infection_radius_sq', self.infection_radius ** 2)
+        object.__setattr__(self, '_array_cache', None)
+        object.__setattr__(self, '_struct_cache', None)
+
+    def reset(self):
+        """Restore every parameter to its module-level default value."""
+        self.from_dict(_DEFAULTS)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_snapshot_cache', None)
+        object.__setattr__(self, '_array_cache', None)
+        object.__setattr__(self, '_struct_cache', None)
+        if name in self._R0_FIELDS:
+            object.__setattr__(self, '_r0_cache', None)
+        if name == 'infection_radius':
+            object.__setattr__(self, '_infection_radius_sq', value * value)
+
+    @property
+    def infection_radius_sq(self):
+        """Squared infection radius, kept in sync by __setattr__ so the
+        per-pair distance check never pays for the multiply."""
+        return self._infection_radius_sq
+
+    @property
+    def effective_distance_factor(self):
+        """Population-wide social distancing strength (factor x compliance)."""
+        return self.social_distance_factor * self.social_distance_obedient
+
+    def __eq__(self, other):
+        if not isinstance(other, SimParams):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._FIELDS)
+
+    def __hash__(self):
+        # Allows memoizing expensive scenario runs keyed on the parameter
+        # set. Note SimParams is mutable: hash the object only at a point
+        # in time (or hash snapshot() for the hot-loop subset), never use a
+        # live instance as a dict key while sliders can still change it.
+        return hash(tuple(getattr(self, f) for f in self._FIELDS))
+
+    def snapshot(self):
+        """
+        Return a SimSnapshot of the current hot-loop parameters.
+
+        The snapshot is cached and rebuilt lazily after any parameter
+        write, so calling this once per simulation step is essentially free
+        while sliders are untouched.
+
+        Returns:
+            SimSnapshot: Frozen view with precomputed derived values
+        """
+        if self._snapshot_cache is None:
+            object.__setattr__(self, '_snapshot_cache', SimSnapshot(
+                infection_radius=self.infection_radius,
+                infection_radius_sq=self.infection_radius ** 2,
+                prob_infection=self.prob_infection,
+                per_step_infection_prob=self.prob_infection / self.time_steps_per_day,
+                prob_no_symptoms=self.prob_no_symptoms,
+                boxes_to_consider=int(self.boxes_to_consider),
+                speed_limit=self.speed_limit,
+                boundary_force=self.boundary_force,
+                social_distance_factor=self.social_distance_factor,
+                social_distance_obedient=self.social_distance_obedient,
+                time_steps_per_day=self.time_steps_per_day,
+                infection_duration=self.infection_duration,
+                mortality_rate=self.mortality_rate,
+                quarantine_enabled=self.quarantine_enabled,
+                quarantine_after=self.quarantine_after,
+                quarantine_duration=self.quarantine_duration,
+                start_quarantine=self.start_quarantine,
+            ))
+        return self._snapshot_cache
+
+    def _estimate_r0(self):
+        """
+        Estimate the basic reproduction number R0 for the current parameters.
+
+        Uses a mean-field approximation: expected contacts per day (particle
+        density times infection-radius area) times per-contact infection
+        probability times infection duration, damped by social distancing.
+
+        The result is cached; writing any field in _R0_FIELDS invalidates
+        the cache, so UI sliders that re-query R0 per tick stay cheap.
+
+        Returns:
+            float: Estimated R0 value
+        """
+        if self._r0_cache is None:
+            area = 4.0  # Simple-mode bounds are (-1, 1) x (-1, 1)
+            contacts_per_day = math.pi * self.infection_radius ** 2 * self.num_particles / area
+            damping = max(0.0, 1.0 - self.social_distance_factor * self.social_distance_obedient * 0.3)
+            r0 = self.prob_infection * contacts_per_day * self.infection_duration * damping
+            object.__setattr__(self, '_r0_cache', r0)
+        return self._r0_cache
+
+    def validate(self):
+        """
+        Check all numeric parameters against their valid ranges.
+
+        Runs the predicates precompiled from _BOUNDS in a single loop;
+        error strings are only formatted when a violation is actually
+        found, so the happy path allocates nothing.
+
+        Returns:
+            list: Human-readable error strings (empty if all values valid)
+        """
+        errors = []
+        for name, ok, desc in self._CHECKS:
+            v = getattr(self, name)
+            if not ok(v):
+                errors.append(f"{name} must be in range {desc} (got {v})")
+        if errors:
+            log.warning("Parameter validation failed: %s", errors)
+        return errors
+
+    def to_dict(self):
+        """
+        Export all parameters as a plain dict (e.g. for JSON serialization).
+
+        Returns:
+            dict: Parameter name -> current value for every field in _FIELDS
+        """
+        return {f: getattr(self, f) for f in self._FIELDS}
+
+    def from_dict(self, data):
+        """
+        Load parameter values from a dict, ignoring unknown keys.
+
+        Args:
+            data (dict): Parameter name -> value (partial dicts are allowed)
+        """
+        for f in self._FIELDS:
+            if f in data:
+                setattr(self, f, data[f])
+
+    def as_array(self):
+        """
+        Return all parameters as a C-contiguous float64 array.
+
+        Compiled kernels (Numba/Cython) can take this single array instead
+        of reading 30 Python attributes per call; index entries via the
+        class-level FIELD_INDEX map. The array is cached and rebuilt lazily
+        after any parameter write - treat it as read-only.
+
+        Returns:
+            np.ndarray: Shape (len(_FIELDS),) float64 parameter vector
+        """
+        if self._array_cache is None:
+            arr = np.fromiter(
+                (float(getattr(self, f)) for f in self._FIELDS),
+                dtype=np.float64, count=len(self._FIELDS),
+            )
+            object.__setattr__(self, '_array_cache', arr)
+        return self._array_cache
+
+    def as_struct(self):
+        """
+        Return all parameters as one NumPy structured record.
+
+        Unlike as_array(), each field keeps its native type (f8/i4/bool)
+        per the module-level _DTYPE, so C extensions can memcpy a single
+        POD struct instead of unboxing 30 Python objects. Cached and
+        rebuilt lazily after any parameter write - treat as read-only.
+
+        Returns:
+            np.ndarray: 0-d array of dtype _DTYPE (access fields by name)
+        """
+        if self._struct_cache is None:
+            rec = np.zeros((), dtype=_DTYPE)
+            for f in self._FIELDS:
+                rec[f] = getattr(self, f)
+            object.__setattr__(self, '_struct_cache', rec)
+        return self._struct_cache
+
+    def save_to_file(self, filename):
+        """
+        Save all parameters to a JSON file.
+
+        Args:
+            filename (str): Path of the file to write
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        log.info("Configuration saved to %s", filename)
+
+    def load_from_file(self, filename):
+        """
+        Load parameters from a JSON file written by save_to_file.
+
+        When fastjsonschema is installed the loaded dict is checked in one
+        compiled validator pass; otherwise the values are range-checked by
+        validate() after assignment.
+
+        Args:
+            filename (str): Path of the file to read
+        """
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filename) as f:
+                data = json.load(f)
+        schema_check = _get_schema_validator()
+        if schema_check is not None:
+            schema_check(data)
+            self.from_dict(data)
+        else:
+            self.from_dict(data)
+            self.validate()
+        log.info("Configuration loaded from %s", filename)
 
 
 # Global instance
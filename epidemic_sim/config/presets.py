@@ -15,20 +15,100 @@ All presets include:
 - social_distance_obedient: Compliance rate
 - boxes_to_consider: Infection spread range
 """
+import math
+import sys
+from dataclasses import dataclass, asdict, field, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, TypedDict
 
-PRESETS = {
+import numpy as np
+
+
+class PresetDict(TypedDict):
+    """
+    Schema of a single preset entry in PRESETS.
+
+    Every preset carries exactly these keys with these types; the stable
+    dict shape also lets CPython's inline caches (and ahead-of-time
+    compilers like mypyc) specialize the lookup paths. The underscore
+    fields are derived at import by the post-processing pass below.
+    """
+    infection_radius: float
+    prob_infection: float
+    fraction_infected_init: float
+    infection_duration: int
+    mortality_rate: float
+    social_distance_factor: float
+    social_distance_obedient: float
+    boxes_to_consider: int
+    quarantine_after: int
+    start_quarantine: int
+    prob_no_symptoms: float
+    _log1m_prob_infection: float
+    _daily_mortality: float
+    _recovery_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class Preset:
+    """
+    Immutable, typed view of a single preset.
+
+    A slotted instance is a fraction of the size of the equivalent dict and
+    gives consumers plain attribute access (no hash per field read); use
+    get_preset() to obtain one and asdict() where a mapping is needed.
+    """
+    infection_radius: float
+    prob_infection: float
+    fraction_infected_init: float
+    infection_duration: int
+    mortality_rate: float
+    social_distance_factor: float
+    social_distance_obedient: float
+    boxes_to_consider: int
+    quarantine_after: int
+    start_quarantine: int
+    prob_no_symptoms: float
+    # Derived once at construction; radius checks compare squared
+    # distances against this and never take a sqrt
+    infection_radius_sq: float = field(init=False)
+
+    def __post_init__(self):
+        # object.__setattr__ because the dataclass is frozen
+        object.__setattr__(self, 'infection_radius_sq',
+                           self.infection_radius ** 2)
+
+    def asdict(self):
+        """Return the preset as a plain field -> value dict."""
+        return asdict(self)
+
+# Shared literal values - one float object each instead of one per
+# occurrence, and a single edit point if the encoding ever changes
+_PZ_HALF_PCT = 0.005  # Patient Zero: 0.5%
+_PZ_1PCT = 0.01       # Patient Zero: 1%
+_PZ_2PCT = 0.02       # Patient Zero: 2%
+_BOXES_DEFAULT = 2    # Default infection spread range (grid cells)
+
+# Shared by every preset that models no intervention - spliced in with
+# `**_COMMON` so the values exist once instead of being repeated per preset
+_COMMON = {
+    'social_distance_factor': 0.0,
+    'social_distance_obedient': 1.0,
+}
+
+_PRESET_DATA = {
     # === REAL DISEASE PRESETS (Based on actual epidemiological data) ===
 
     "COVID-19 (Original Strain)": {
         # R0: 2.5-3.0 | CFR: 1-2% | Incubation: 5-6 days | Asymptomatic: 30-40%
         'infection_radius': 0.15,
         'prob_infection': 0.03,  # Moderate contagiousness
-        'fraction_infected_init': 0.005,  # Patient Zero: 0.5%
+        'fraction_infected_init': _PZ_HALF_PCT,  # Patient Zero: 0.5%
         'infection_duration': 14,  # 14-day disease course
         'mortality_rate': 0.015,  # 1.5% CFR
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 5,  # After incubation
         'start_quarantine': 10,  # Delayed response
         'prob_no_symptoms': 0.35,  # 35% asymptomatic
@@ -38,12 +118,11 @@ PRESETS = {
         # R0: 5-6 | CFR: 0.5-1% | Incubation: 4 days | Asymptomatic: 40%
         'infection_radius': 0.20,  # More airborne
         'prob_infection': 0.05,  # Highly contagious
-        'fraction_infected_init': 0.005,  # Patient Zero: 0.5%
+        'fraction_infected_init': _PZ_HALF_PCT,  # Patient Zero: 0.5%
         'infection_duration': 10,  # Shorter course
         'mortality_rate': 0.008,  # 0.8% CFR
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 4,  # Shorter incubation
         'start_quarantine': 8,
         'prob_no_symptoms': 0.40,  # 40% asymptomatic
@@ -53,12 +132,11 @@ PRESETS = {
         # R0: 7-10 | CFR: 0.1-0.3% | Incubation: 3 days | Asymptomatic: 50%
         'infection_radius': 0.22,  # Highly airborne
         'prob_infection': 0.07,  # Extremely contagious
-        'fraction_infected_init': 0.01,  # Patient Zero: 1%
+        'fraction_infected_init': _PZ_1PCT,  # Patient Zero: 1%
         'infection_duration': 7,  # Much shorter course
         'mortality_rate': 0.002,  # 0.2% CFR (much lower)
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 3,  # Very short incubation
         'start_quarantine': 5,
         'prob_no_symptoms': 0.50,  # 50% asymptomatic
@@ -68,12 +146,11 @@ PRESETS = {
         # R0: 1.8-2.0 | CFR: 2-10% | Incubation: 1-4 days | Asymptomatic: 15%
         'infection_radius': 0.18,
         'prob_infection': 0.025,  # Moderate contagiousness
-        'fraction_infected_init': 0.01,  # Patient Zero: 1%
+        'fraction_infected_init': _PZ_1PCT,  # Patient Zero: 1%
         'infection_duration': 7,  # Acute phase
         'mortality_rate': 0.05,  # 5% CFR (devastating)
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 2,  # Short incubation
         'start_quarantine': 5,  # Limited early response (1918)
         'prob_no_symptoms': 0.15,  # 15% asymptomatic
@@ -83,11 +160,10 @@ PRESETS = {
         # R0: 12-18 (most contagious known) | CFR: 0.2% | Incubation: 10-12 days | Asymptomatic: 5%
         'infection_radius': 0.30,  # Highly airborne (can spread rooms away)
         'prob_infection': 0.12,  # Extremely contagious
-        'fraction_infected_init': 0.005,  # Patient Zero: 0.5%
+        'fraction_infected_init': _PZ_HALF_PCT,  # Patient Zero: 0.5%
         'infection_duration': 10,
         'mortality_rate': 0.002,  # 0.2% CFR
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
+        **_COMMON,
         'boxes_to_consider': 3,  # Longer range
         'quarantine_after': 3,  # Early quarantine needed
         'start_quarantine': 5,
@@ -98,11 +174,10 @@ PRESETS = {
         # R0: 1.5-2.5 | CFR: 50% | Incubation: 8-10 days | Asymptomatic: 10%
         'infection_radius': 0.10,  # Close contact/bodily fluids
         'prob_infection': 0.08,  # High contact infection rate
-        'fraction_infected_init': 0.005,  # Patient Zero: 0.5%
+        'fraction_infected_init': _PZ_HALF_PCT,  # Patient Zero: 0.5%
         'infection_duration': 14,  # 2-3 week illness
         'mortality_rate': 0.50,  # 50% CFR (deadly)
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
+        **_COMMON,
         'boxes_to_consider': 1,  # Requires very close contact
         'quarantine_after': 5,
         'start_quarantine': 3,  # Rapid response needed
@@ -113,12 +188,11 @@ PRESETS = {
         # R0: 1.3-1.8 | CFR: 0.1% | Incubation: 1-4 days | Asymptomatic: 20%
         'infection_radius': 0.15,
         'prob_infection': 0.018,  # Moderate contagiousness
-        'fraction_infected_init': 0.01,  # Patient Zero: 1%
+        'fraction_infected_init': _PZ_1PCT,  # Patient Zero: 1%
         'infection_duration': 7,  # Week-long illness
         'mortality_rate': 0.001,  # 0.1% CFR
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 3,
         'start_quarantine': 7,
         'prob_no_symptoms': 0.20,  # 20% asymptomatic
@@ -128,12 +202,11 @@ PRESETS = {
         # R0: 2-3 | CFR: 0% | Incubation: 2-3 days | Asymptomatic: 25%
         'infection_radius': 0.15,
         'prob_infection': 0.025,  # Moderate contagiousness
-        'fraction_infected_init': 0.02,  # Patient Zero: 2%
+        'fraction_infected_init': _PZ_2PCT,  # Patient Zero: 2%
         'infection_duration': 7,  # Week-long symptoms
         'mortality_rate': 0.0,  # No mortality
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 5,  # Usually no quarantine
         'start_quarantine': 30,  # No intervention (cold)
         'prob_no_symptoms': 0.25,  # 25% asymptomatic
@@ -143,12 +216,11 @@ PRESETS = {
         # R0: 2-3 | CFR: 10% | Incubation: 4-6 days | Asymptomatic: 10%
         'infection_radius': 0.18,
         'prob_infection': 0.03,  # Moderate contagiousness
-        'fraction_infected_init': 0.005,  # Patient Zero: 0.5%
+        'fraction_infected_init': _PZ_HALF_PCT,  # Patient Zero: 0.5%
         'infection_duration': 14,
         'mortality_rate': 0.10,  # 10% CFR (severe)
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 4,
         'start_quarantine': 3,  # Aggressive response
         'prob_no_symptoms': 0.10,  # 10% asymptomatic
@@ -158,12 +230,11 @@ PRESETS = {
         # R0: 0.6-0.9 (low transmission) | CFR: 35% | Incubation: 5-6 days | Asymptomatic: 10%
         'infection_radius': 0.12,  # Close contact mainly
         'prob_infection': 0.015,  # Lower contagiousness
-        'fraction_infected_init': 0.005,  # Patient Zero: 0.5%
+        'fraction_infected_init': _PZ_HALF_PCT,  # Patient Zero: 0.5%
         'infection_duration': 14,
         'mortality_rate': 0.35,  # 35% CFR (very deadly)
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 5,
         'start_quarantine': 3,
         'prob_no_symptoms': 0.10,  # 10% asymptomatic
@@ -175,12 +246,11 @@ PRESETS = {
         # Generic moderate epidemic for teaching
         'infection_radius': 0.15,
         'prob_infection': 0.15,  # High visibility
-        'fraction_infected_init': 0.01,  # Patient Zero: 1%
+        'fraction_infected_init': _PZ_1PCT,  # Patient Zero: 1%
         'infection_duration': 25,
         'mortality_rate': 0.02,  # 2% CFR
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 5,
         'start_quarantine': 10,
         'prob_no_symptoms': 0.20,
@@ -190,12 +260,11 @@ PRESETS = {
         # Low R0, long duration epidemic
         'infection_radius': 0.10,
         'prob_infection': 0.01,  # Very slow spread
-        'fraction_infected_init': 0.005,  # Patient Zero: 0.5%
+        'fraction_infected_init': _PZ_HALF_PCT,  # Patient Zero: 0.5%
         'infection_duration': 30,  # Long illness
         'mortality_rate': 0.01,  # 1% CFR
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 8,
         'start_quarantine': 15,
         'prob_no_symptoms': 0.15,
@@ -205,12 +274,11 @@ PRESETS = {
         # High R0, rapid spread
         'infection_radius': 0.30,
         'prob_infection': 0.05,  # Fast spread
-        'fraction_infected_init': 0.02,  # Patient Zero: 2%
+        'fraction_infected_init': _PZ_2PCT,  # Patient Zero: 2%
         'infection_duration': 20,
         'mortality_rate': 0.03,  # 3% CFR
-        'social_distance_factor': 0.0,
-        'social_distance_obedient': 1.0,
-        'boxes_to_consider': 2,
+        **_COMMON,
+        'boxes_to_consider': _BOXES_DEFAULT,
         'quarantine_after': 3,
         'start_quarantine': 5,
         'prob_no_symptoms': 0.25,
@@ -220,7 +288,7 @@ PRESETS = {
         # Teaching intervention effectiveness
         'infection_radius': 0.15,
         'prob_infection': 0.02,
-        'fraction_infected_init': 0.01,  # Patient Zero: 1%
+        'fraction_infected_init': _PZ_1PCT,  # Patient Zero: 1%
         'infection_duration': 25,
         'mortality_rate': 0.02,  # 2% CFR
         'social_distance_factor': 0.5,  # Weak intervention
@@ -235,7 +303,7 @@ PRESETS = {
         # Teaching strong intervention
         'infection_radius': 0.15,
         'prob_infection': 0.02,
-        'fraction_infected_init': 0.01,  # Patient Zero: 1%
+        'fraction_infected_init': _PZ_1PCT,  # Patient Zero: 1%
         'infection_duration': 25,
         'mortality_rate': 0.02,  # 2% CFR
         'social_distance_factor': 1.5,  # Strong intervention
@@ -246,3 +314,224 @@ PRESETS = {
         'prob_no_symptoms': 0.20,
     },
 }
+
+# Derived hazard terms, computed once here instead of per tick. The
+# underscore keys are skipped by the UI's slider loader; hot loops read
+# them as cached floats:
+#   exp(contacts * _log1m_prob_infection)  ==  (1 - prob_infection)**contacts
+# (one exp instead of a pow per agent), and the per-day death/recovery
+# hazards avoid re-deriving 1/duration powers every step.
+for _p in _PRESET_DATA.values():
+    _p['_log1m_prob_infection'] = math.log1p(-_p['prob_infection'])
+    _p['_daily_mortality'] = (
+        1.0 - (1.0 - _p['mortality_rate']) ** (1.0 / _p['infection_duration'])
+    )
+    _p['_recovery_rate'] = 1.0 / _p['infection_duration']
+del _p
+
+# Intern the preset names so every later == / dict hit between the
+# dropdown, keyboard shortcuts, and simulation short-circuits on pointer
+# identity instead of a full string compare
+_PRESET_DATA = {sys.intern(name): preset for name, preset in _PRESET_DATA.items()}
+
+# Read-only public view - the derived tables below are built from the
+# preset data once at import and would silently go stale if callers could
+# mutate the dict underneath them
+PRESETS: Mapping[str, PresetDict] = MappingProxyType(_PRESET_DATA)
+
+# Preset grouping for the UI, mirroring the section markers in the data
+# above
+PRESET_CATEGORIES = {
+    'Real Diseases': [
+        "COVID-19 (Original Strain)",
+        "COVID-19 (Delta Variant)",
+        "COVID-19 (Omicron Variant)",
+        "Spanish Flu (1918)",
+        "Measles",
+        "Ebola (2014 Outbreak)",
+        "Influenza (Seasonal)",
+        "Common Cold (Rhinovirus)",
+        "SARS (2003)",
+        "MERS (Coronavirus)",
+    ],
+    'Educational': [
+        "Baseline Epidemic",
+        "Slow Burn",
+        "Fast Outbreak",
+        "Social Distancing (Weak)",
+        "Social Distancing (Strong)",
+    ],
+}
+
+# Same interning treatment for the category labels and member lists
+PRESET_CATEGORIES = {
+    sys.intern(category): [sys.intern(name) for name in names]
+    for category, names in PRESET_CATEGORIES.items()
+}
+
+# Flattened reverse index so "which category is this preset in?" is one
+# hash lookup instead of a scan over every category list
+_NAME_TO_CATEGORY = {
+    name: category
+    for category, names in PRESET_CATEGORIES.items()
+    for name in names
+}
+
+# Fail at import (not at UI time) if the category lists drift out of sync
+# with the preset table
+assert _NAME_TO_CATEGORY.keys() == PRESETS.keys(), \
+    "PRESET_CATEGORIES out of sync with PRESETS"
+
+# Guard against a partial preset entry (or a stray second PRESETS
+# definition) silently dropping epidemiological fields
+assert all('mortality_rate' in p for p in PRESETS.values()), \
+    "preset entry missing mortality_rate"
+
+
+def preset_category(name):
+    """
+    Get the category label for a preset.
+
+    Args:
+        name (str): Preset name (a PRESETS key)
+
+    Returns:
+        str: Category label (a PRESET_CATEGORIES key)
+    """
+    return _NAME_TO_CATEGORY[name]
+
+
+# === STRUCTURED PRESET TABLE ===
+# Contiguous SoA view of the presets above: one typed row per preset, so
+# numeric consumers (parameter sweeps, vectorized setup) read plain machine
+# floats instead of chasing dict-of-dict Python objects.
+PRESET_DTYPE = np.dtype([
+    ('infection_radius', 'f4'),
+    ('prob_infection', 'f4'),
+    ('fraction_infected_init', 'f4'),
+    ('infection_duration', 'i2'),
+    ('mortality_rate', 'f4'),
+    ('social_distance_factor', 'f4'),
+    ('social_distance_obedient', 'f4'),
+    ('boxes_to_consider', 'i1'),
+    ('quarantine_after', 'i2'),
+    ('start_quarantine', 'i2'),
+    ('prob_no_symptoms', 'f4'),
+])
+
+def _build_preset_table():
+    """Build the structured preset table from the canonical literal."""
+    return np.array(
+        [tuple(p[f] for f in PRESET_DTYPE.names) for p in PRESETS.values()],
+        dtype=PRESET_DTYPE,
+    )
+
+
+def _load_preset_table():
+    """
+    Load the structured preset table.
+
+    Prefers the compiled presets.npy cache next to this module (written by
+    freeze_presets.py) and mmaps it, so start-up shares one read-only page
+    with other processes and skips rebuilding the rows from the literal.
+    Falls back to building from PRESETS if the cache is absent or stale
+    (wrong dtype or row count after a preset edit without a re-freeze).
+    """
+    cache = Path(__file__).with_name('presets.npy')
+    if cache.is_file():
+        try:
+            table = np.load(cache, mmap_mode='r')
+            if table.dtype == PRESET_DTYPE and len(table) == len(PRESETS):
+                return table
+        except (OSError, ValueError):
+            pass
+    return _build_preset_table()
+
+
+_PRESET_TABLE = _load_preset_table()
+
+# name -> row index into _PRESET_TABLE
+_PRESET_INDEX = {name: i for i, name in enumerate(PRESETS)}
+
+
+# Flat C-contiguous float32 matrix (one row per preset, one column per
+# field) for bulk parameter sweeps - reading a value is one strided load,
+# and the whole table is ~660 bytes so it lives in L1
+PRESET_FIELDS = PRESET_DTYPE.names
+PRESET_MATRIX = np.array(
+    [[p[f] for f in PRESET_FIELDS] for p in PRESETS.values()],
+    dtype=np.float32,
+)
+PRESET_ROW = {name: i for i, name in enumerate(PRESETS)}
+PRESET_COL = {f: i for i, f in enumerate(PRESET_FIELDS)}
+
+# Probability fields quantized to uint16 fixed point (value * 65535).
+# Lets integer hot loops draw randint(0, 65536) and compare, instead of a
+# float multiply per agent. Max quantization error is 1/131070 (~8e-6),
+# far below the epidemiological uncertainty of the presets themselves;
+# the float table above stays canonical.
+PROB_FIELDS = ('prob_infection', 'fraction_infected_init',
+               'mortality_rate', 'social_distance_obedient',
+               'prob_no_symptoms')
+
+PRESET_PROBS_Q16 = np.array(
+    [[round(p[f] * 65535) for f in PROB_FIELDS] for p in PRESETS.values()],
+    dtype=np.uint16,
+)
+
+
+def preset_prob_q16(name, field):
+    """
+    Get a preset probability as a uint16 fixed-point value (x 65535).
+
+    Args:
+        name (str): Preset name (a PRESETS key)
+        field (str): One of PROB_FIELDS
+
+    Returns:
+        np.uint16: Scaled probability for integer comparison draws
+    """
+    return PRESET_PROBS_Q16[_PRESET_INDEX[name], PROB_FIELDS.index(field)]
+
+
+# Name tuples cached once for UI dropdowns / shortcut handling - consumers
+# must treat these as read-only
+PRESET_NAMES = tuple(PRESETS)
+CATEGORY_NAMES = tuple(PRESET_CATEGORIES)
+PRESETS_BY_CATEGORY = {
+    category: tuple(names) for category, names in PRESET_CATEGORIES.items()
+}
+
+# Typed instances built once at import; get_preset() is then a single
+# dict hit returning a shared immutable object
+_PRESET_INIT_FIELDS = tuple(f.name for f in fields(Preset) if f.init)
+_PRESET_OBJECTS = {
+    name: Preset(**{f: p[f] for f in _PRESET_INIT_FIELDS})
+    for name, p in PRESETS.items()
+}
+
+
+def get_preset(name):
+    """
+    Get a preset as an immutable typed Preset instance.
+
+    Args:
+        name (str): Preset name (a PRESETS key)
+
+    Returns:
+        Preset: Frozen slotted dataclass with one attribute per field
+    """
+    return _PRESET_OBJECTS[name]
+
+
+def preset_row(name):
+    """
+    Get the structured-array row for a preset.
+
+    Args:
+        name (str): Preset name (a PRESETS key)
+
+    Returns:
+        np.void: Typed record with fields per PRESET_DTYPE
+    """
+    return _PRESET_TABLE[_PRESET_INDEX[name]]
@@ -4,29 +4,97 @@ Epidemic Simulation - Main Entry Point
 This is the main entry point for the epidemic simulation application.
 Run this file to start the simulation with the modular architecture.
 
+PyQt5 and the main window are imported lazily inside main() so that
+argument parsing (and in particular --help and --benchmark) does not pay
+the Qt library load before it is actually needed.
+
 Usage:
     python -m epidemic_sim.main
     or
     python epidemic_sim/main.py
 """
 
+import argparse
 import sys
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QFont
 
-from epidemic_sim.view.main_window import EpidemicApp
+
+def _parse_args(argv):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Argument list (without the program name)
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(
+        prog='epidemic_sim',
+        description='Interactive epidemic particle simulation',
+    )
+    parser.add_argument(
+        '--benchmark', type=int, metavar='N', default=None,
+        help='run N simulation steps without a window and print the step rate',
+    )
+    parser.add_argument(
+        '--mode', choices=('simple', 'communities'), default='simple',
+        help='simulation mode for --benchmark runs (default: simple)',
+    )
+    return parser.parse_args(argv)
+
+
+def _run_benchmark(steps, mode):
+    """
+    Run the simulation engine without a window and report throughput.
+
+    Note: the engine itself uses Qt signals, so the Qt library still
+    loads - but no QApplication, window, or rendering is involved.
+
+    Args:
+        steps (int): Number of simulation steps to run
+        mode (str): Simulation mode ('simple' or 'communities')
+
+    Returns:
+        int: Exit code
+    """
+    import time
+    from epidemic_sim.model.simulation import EpidemicSimulation
+
+    sim = EpidemicSimulation(mode=mode)
+    sim.initialize()
+    start = time.perf_counter()
+    for _ in range(steps):
+        sim.step()
+    elapsed = time.perf_counter() - start
+    print(f"{steps} steps in {elapsed:.3f} s "
+          f"({steps / elapsed:.1f} steps/s, mode={mode})")
+    return 0
 
 
-def main():
+def main(argv=None):
     """
     Main entry point for the Epidemic Simulation application.
 
-    Sets up the QApplication, applies default font settings, creates the main
+    Parses arguments, then either runs a windowless benchmark or sets up
+    the QApplication, applies default font settings, creates the main
     window, and starts the Qt event loop.
 
+    Args:
+        argv: Optional argument list (defaults to sys.argv[1:])
+
     Returns:
         int: Application exit code
     """
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.benchmark is not None:
+        return _run_benchmark(args.benchmark, args.mode)
+
+    # Qt imports deferred to here so --help/--benchmark skip the GUI load
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QFont
+    from epidemic_sim.view.main_window import EpidemicApp
+
     # Create Qt application
     app = QApplication(sys.argv)
 
@@ -10,9 +10,249 @@ Uses THREE statistical distributions as required for IHK project:
 3. EXPONENTIAL - Individual recovery time variation
 """
 import random
+from math import hypot
+
 import numpy as np
 from epidemic_sim.config.parameters import params
 
+# Optional JIT compilation for the infection kernel; the pure-Python
+# fallback below keeps the module fully functional without numba
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Shared module-level Generator (PCG64). Noticeably faster than the
+# legacy np.random.* module functions, which route every call through the
+# global RandomState wrapper; all batched draws below come from here.
+_rng = np.random.default_rng()
+
+# Integer state codes shared by the object and array layouts. Particle
+# stores state_code and derives the string on demand; the codes are the
+# compact (int8) encoding used by vectorized kernels and hot-loop
+# comparisons.
+STATE_SUSCEPTIBLE = 0
+STATE_INFECTED = 1
+STATE_REMOVED = 2
+STATE_DEAD = 3
+
+STATE_NAMES = ('susceptible', 'infected', 'removed', 'dead')
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+
+def sq_distances(ax, ay, bx, by):
+    """
+    Squared distances between two sets of points via broadcasting
+
+    One vectorized pass over contiguous arrays replaces a Python-level
+    distance_to() call per pair; skipping the sqrt keeps it exact for
+    radius comparisons against a squared threshold.
+
+    Args:
+        ax, ay: Coordinate arrays of the first point set (length m)
+        bx, by: Coordinate arrays of the second point set (length k)
+
+    Returns:
+        np.ndarray: (m, k) matrix of squared distances
+    """
+    dx = ax[:, None] - bx[None, :]
+    dy = ay[:, None] - by[None, :]
+    return dx * dx + dy * dy
+
+
+def within_radius(ax, ay, bx, by, radius):
+    """
+    Boolean mask of point pairs within a given radius
+
+    Args:
+        ax, ay: Coordinate arrays of the first point set (length m)
+        bx, by: Coordinate arrays of the second point set (length k)
+        radius: Distance threshold
+
+    Returns:
+        np.ndarray: (m, k) bool matrix, True where distance <= radius
+    """
+    return sq_distances(ax, ay, bx, by) <= radius * radius
+
+
+def try_infect(px, py, state, susceptibility, neighbor_idx, neighbor_off,
+               r2, prob, rand):
+    """
+    Fused transmission kernel over CSR-style neighbor lists
+
+    For each susceptible agent i, scans its candidate neighbors
+    neighbor_idx[neighbor_off[i]:neighbor_off[i+1]] and flips i to
+    infected when an infected neighbor is within the squared radius and
+    the pre-drawn random number clears prob * susceptibility[i]. With
+    numba installed this compiles to a parallel, SIMD-vectorized loop
+    with no interpreter dispatch; without it the same body runs as plain
+    Python.
+
+    Args:
+        px, py: Position columns
+        state: int8 state codes (STATE_* constants), updated in place
+        susceptibility: Per-agent infection susceptibility
+        neighbor_idx: Flattened candidate neighbor indices
+        neighbor_off: Offsets into neighbor_idx, length n+1
+        r2: Squared infection radius
+        prob: Base per-check infection probability
+        rand: Pre-drawn uniform randoms, one per neighbor_idx entry
+    """
+    for i in prange(len(state)):
+        if state[i] != STATE_SUSCEPTIBLE:
+            continue
+        for k in range(neighbor_off[i], neighbor_off[i + 1]):
+            j = neighbor_idx[k]
+            if state[j] != STATE_INFECTED:
+                continue
+            dx = px[i] - px[j]
+            dy = py[i] - py[j]
+            if dx * dx + dy * dy <= r2 and rand[k] < prob * susceptibility[i]:
+                state[i] = STATE_INFECTED
+                break
+
+
+if njit is not None:
+    try_infect = njit(parallel=True, fastmath=True, cache=True)(try_infect)
+
+
+class ParticleArray:
+    """
+    Structure-of-arrays particle storage for vectorized simulation kernels
+
+    Holds one contiguous NumPy column per particle attribute instead of one
+    Python object per particle. Allocating N agents is a handful of batched
+    RNG draws rather than N constructor calls, the per-agent footprint
+    drops from hundreds of bytes of boxed Python values to a few dozen
+    bytes of packed machine types, and every downstream pass (movement,
+    infection checks, state updates) can run as whole-array NumPy
+    operations over contiguous memory.
+
+    Uses the same THREE statistical distributions as Particle:
+    1. UNIFORM - Initial positions and velocities
+    2. NORMAL - Individual infection susceptibility variation
+    3. EXPONENTIAL - Individual recovery time variation
+    """
+
+    __slots__ = (
+        'n', 'x', 'y', 'vx', 'vy', 'ax', 'ay',
+        'state', 'days_infected', 'infection_count',
+        'quarantined', 'days_in_quarantine',
+        'shows_symptoms', 'obeys_social_distance',
+        'infection_susceptibility', 'recovery_time_modifier',
+        'at_marketplace', 'marketplace_timer',
+        'home_x', 'home_y', 'target_x', 'target_y',
+        'traveling_to_marketplace', 'returning_home',
+        'traveling_between_communities', 'target_community_id',
+        '_dx', '_dy', '_d2',
+    )
+
+    @classmethod
+    def allocate(cls, n, bounds=(-1.0, 1.0, -1.0, 1.0), num_infected=0):
+        """
+        Allocate and initialize storage for n particles with batched draws
+
+        Args:
+            n: Number of particles
+            bounds: (x_min, x_max, y_min, y_max) region for initial positions
+            num_infected: Seed the first num_infected agents as infected,
+                with asymptomatic carriers chosen by one vectorized draw
+
+        Returns:
+            ParticleArray: Fully initialized columns for n agents
+        """
+        rng = _rng
+        self = cls.__new__(cls)
+        self.n = n
+
+        # UNIFORM - positions within bounds, velocities without movement
+        # bias. Coordinates are float32 throughout: Qt truncates to ints
+        # for drawing and the radii carry ~3 significant digits, so the
+        # extra float64 bytes are pure bandwidth with no benefit
+        x_min, x_max, y_min, y_max = bounds
+        self.x = rng.uniform(x_min, x_max, n).astype(np.float32, copy=False)
+        self.y = rng.uniform(y_min, y_max, n).astype(np.float32, copy=False)
+        self.vx = rng.uniform(-0.2, 0.2, n).astype(np.float32, copy=False)
+        self.vy = rng.uniform(-0.2, 0.2, n).astype(np.float32, copy=False)
+        self.ax = np.zeros(n, dtype=np.float32)
+        self.ay = np.zeros(n, dtype=np.float32)
+
+        # Epidemiological state (int8 codes, see STATE_* above)
+        self.state = np.full(n, STATE_SUSCEPTIBLE, dtype=np.int8)
+        self.days_infected = np.zeros(n, dtype=np.int16)
+        self.infection_count = np.zeros(n, dtype=np.int16)
+
+        # Behavior and symptoms (one byte per flag)
+        self.quarantined = np.zeros(n, dtype=np.bool_)
+        self.days_in_quarantine = np.zeros(n, dtype=np.int16)
+        self.shows_symptoms = np.ones(n, dtype=np.bool_)
+        self.obeys_social_distance = rng.random(n) < params.social_distance_obedient
+
+        # NORMAL - infection susceptibility, clamped positive. Stored as
+        # float32: these are probability modifiers streamed by the
+        # infection kernel every tick, and halving their bytes doubles
+        # both cache residency and SIMD lanes at no meaningful precision
+        # cost.
+        self.infection_susceptibility = np.maximum(
+            0.1, rng.normal(1.0, 0.2, n)).astype(np.float32, copy=False)
+
+        # EXPONENTIAL - recovery time, clamped to 0.5x-3.0x base duration
+        self.recovery_time_modifier = np.clip(
+            rng.exponential(1.0, n), 0.5, 3.0).astype(np.float32, copy=False)
+
+        # Marketplace tracking (home/target start at the spawn position)
+        self.at_marketplace = np.zeros(n, dtype=np.bool_)
+        self.marketplace_timer = np.zeros(n, dtype=np.int16)
+        self.home_x = self.x.copy()
+        self.home_y = self.y.copy()
+        self.target_x = self.x.copy()
+        self.target_y = self.y.copy()
+        self.traveling_to_marketplace = np.zeros(n, dtype=np.bool_)
+        self.returning_home = np.zeros(n, dtype=np.bool_)
+
+        # Community travel tracking (-1 = no target community)
+        self.traveling_between_communities = np.zeros(n, dtype=np.bool_)
+        self.target_community_id = np.full(n, -1, dtype=np.int16)
+
+        # Reusable per-tick scratch for distance work (see
+        # sq_distances_from) - allocated once so hot loops do zero
+        # allocations and the working set stays cache-resident
+        self._dx = np.empty(n, dtype=np.float32)
+        self._dy = np.empty(n, dtype=np.float32)
+        self._d2 = np.empty(n, dtype=np.float32)
+
+        # Seed initial infections: one batched draw decides which carriers
+        # are asymptomatic, replacing a per-particle random.random() branch
+        if num_infected:
+            self.state[:num_infected] = STATE_INFECTED
+            self.shows_symptoms[:num_infected] = (
+                rng.random(num_infected) >= params.prob_no_symptoms)
+
+        return self
+
+    def sq_distances_from(self, x0, y0):
+        """
+        Squared distances from a point to every agent, without allocating
+
+        Writes into the preallocated scratch buffers using out= ufunc
+        calls, so per-tick callers (infection source scans, marketplace
+        targeting) generate no garbage at all.
+
+        Args:
+            x0, y0: Query point
+
+        Returns:
+            np.ndarray: View of the scratch buffer holding the n squared
+                distances - valid until the next call
+        """
+        np.subtract(self.x, x0, out=self._dx)
+        np.subtract(self.y, y0, out=self._dy)
+        np.multiply(self._dx, self._dx, out=self._d2)
+        np.multiply(self._dy, self._dy, out=self._dy)
+        np.add(self._d2, self._dy, out=self._d2)
+        return self._d2
+
 
 class Particle:
     """
@@ -25,13 +265,33 @@ class Particle:
     - Behavior flags: quarantine status, symptom display, social distancing
     """
 
-    def __init__(self, x, y, state='susceptible'):
+    # Slots drop the per-instance __dict__ (~40% smaller particles),
+    # make attribute access a C-level descriptor lookup, and catch
+    # attribute typos at assignment time
+    __slots__ = (
+        'x', 'y', 'vx', 'vy', 'ax', 'ay',
+        'state_code', 'days_infected', 'infection_count',
+        'quarantined', 'days_in_quarantine',
+        'shows_symptoms', 'obeys_social_distance',
+        'infection_susceptibility', 'recovery_time_modifier',
+        'at_marketplace', 'marketplace_timer',
+        'home_x', 'home_y', 'target_x', 'target_y',
+        'traveling_to_marketplace', 'returning_home',
+        'traveling_between_communities', 'target_community_id',
+        'traveling', '_cell_key',
+    )
+
+    def __init__(self, x, y, state='susceptible', _sdo=None, _pns=None):
         """
         Initialize a particle with position and state
 
         Args:
             x, y: Initial position coordinates
             state: Initial epidemiological state ('susceptible', 'infected', 'removed')
+            _sdo: Pre-read params.social_distance_obedient; population-building
+                loops pass it once instead of re-reading the params proxy
+                per particle
+            _pns: Pre-read params.prob_no_symptoms, same purpose
         """
         # POSITION (initialized with parameters, will use UNIFORM distribution in simulation)
         self.x = x
@@ -45,8 +305,9 @@ class Particle:
         self.ax = 0  # Acceleration X
         self.ay = 0  # Acceleration Y
 
-        # Epidemiological state
-        self.state = state
+        # Epidemiological state, stored as an int8 code so hot loops
+        # compare small ints instead of hashing strings every tick
+        self.state_code = STATE_CODES[state]
         self.days_infected = 0
         self.infection_count = 0
 
@@ -54,7 +315,9 @@ class Particle:
         self.quarantined = False
         self.days_in_quarantine = 0  # Track quarantine duration
         self.shows_symptoms = True
-        self.obeys_social_distance = random.random() < params.social_distance_obedient
+        if _sdo is None:
+            _sdo = params.social_distance_obedient
+        self.obeys_social_distance = random.random() < _sdo
 
         # DISTRIBUTION 2: NORMAL DISTRIBUTION (Normalverteilung) - Infection Susceptibility
         # Models biological variation in immune response
@@ -62,7 +325,7 @@ class Particle:
         # Result: Most people near average, few very susceptible/resistant
         # Ensures ~68% of population between 0.8-1.2 susceptibility
         # Value is clamped to positive range to avoid negative susceptibility
-        self.infection_susceptibility = max(0.1, np.random.normal(1.0, 0.2))
+        self.infection_susceptibility = max(0.1, _rng.normal(1.0, 0.2))
 
         # DISTRIBUTION 3: EXPONENTIAL DISTRIBUTION (Exponentialverteilung) - Recovery Time
         # Models time until recovery event occurs
@@ -70,7 +333,7 @@ class Particle:
         # Exponential has "memoryless property" - ideal for event timing
         # Some recover quickly (<1.0x), others take longer (>1.0x)
         # Value is clamped to reasonable range (0.5x to 3.0x base duration)
-        self.recovery_time_modifier = np.clip(np.random.exponential(1.0), 0.5, 3.0)
+        self.recovery_time_modifier = np.clip(_rng.exponential(1.0), 0.5, 3.0)
 
         # Marketplace tracking
         self.at_marketplace = False
@@ -86,9 +349,30 @@ class Particle:
         self.traveling_between_communities = False
         self.target_community_id = None
 
+        # Fused travel flag: True whenever any of the three travel
+        # modes above is active, so the per-step partition pays one
+        # attribute load instead of three
+        self.traveling = False
+
+        # Current SpatialGrid cell (maintained by the grid for
+        # incremental updates; None = not in a grid)
+        self._cell_key = None
+
         # Check if particle is asymptomatic infected
-        if state == 'infected' and random.random() < params.prob_no_symptoms:
-            self.shows_symptoms = False
+        if state == 'infected':
+            if _pns is None:
+                _pns = params.prob_no_symptoms
+            if random.random() < _pns:
+                self.shows_symptoms = False
+
+    @property
+    def state(self):
+        """str: State name derived from state_code, for display and logs."""
+        return STATE_NAMES[self.state_code]
+
+    @state.setter
+    def state(self, name):
+        self.state_code = STATE_CODES[name]
 
     def distance_to(self, other):
         """
@@ -100,6 +384,40 @@ class Particle:
         Returns:
             float: Distance between this particle and the other
         """
+        # Single C-level call instead of Python-level multiply/add + **0.5
+        return hypot(self.x - other.x, self.y - other.y)
+
+    def sq_distance_to(self, other):
+        """
+        Squared Euclidean distance to another particle
+
+        Preferred in loops that only compare against a radius - the
+        comparison works against r*r with no sqrt at all.
+
+        Args:
+            other: Another Particle object
+
+        Returns:
+            float: Squared distance between the particles
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
+    def _within(self, other, r2):
+        """
+        Check whether another particle lies within a squared radius
+
+        Radius filters should prefer this over distance_to() - comparing
+        squared distances skips the sqrt entirely.
+
+        Args:
+            other: Another Particle object
+            r2: Squared distance threshold
+
+        Returns:
+            bool: True if the squared distance is <= r2
+        """
         dx = self.x - other.x
         dy = self.y - other.y
-        return (dx * dx + dy * dy) ** 0.5
+        return dx * dx + dy * dy <= r2
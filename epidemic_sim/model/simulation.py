@@ -16,12 +16,77 @@ Classes:
 
 import random
 import math
+
+import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal
 
 from epidemic_sim.config.parameters import params
-from epidemic_sim.model.particle import Particle
+from epidemic_sim.model.particle import (
+    Particle, STATE_SUSCEPTIBLE, STATE_INFECTED, STATE_DEAD, STATE_REMOVED)
 from epidemic_sim.model.spatial_grid import SpatialGrid
 
+# Shared PCG64 generator for all batched draws in the step pipeline
+_rng = np.random.default_rng()
+
+
+def _physics_arrays(x, y, vx, vy, rax, ray, bounds, bf, dt, max_speed):
+    """
+    Whole-array physics update for non-traveling particles.
+
+    Applies branchless boundary forces, pre-drawn random accelerations,
+    a squared-speed clamp and position integration, then soft-bounce
+    clamping to bounds - all as in-place NumPy passes, mirroring the
+    scalar logic in _update_particle_physics (with no social-distance
+    term; callers only take this path when that factor is zero).
+
+    Args:
+        x, y, vx, vy: Position/velocity columns, updated in place
+        rax, ray: Pre-drawn random accelerations, one per particle
+        bounds: (xmin, xmax, ymin, ymax)
+        bf: Boundary force strength
+        dt: Time step
+        max_speed: Speed limit
+    """
+    min_dist = 0.15
+    inv_min = 1.0 / min_dist
+
+    # max(0, 1 - dist/min_dist) is branchless and SIMD-friendly; the
+    # four edge forces collapse into two array expressions
+    fx = bf * (np.maximum(0.0, 1.0 - (x - bounds[0]) * inv_min)
+               - np.maximum(0.0, 1.0 - (bounds[1] - x) * inv_min))
+    fy = bf * (np.maximum(0.0, 1.0 - (y - bounds[2]) * inv_min)
+               - np.maximum(0.0, 1.0 - (bounds[3] - y) * inv_min))
+
+    vx += (rax + fx) * dt
+    vy += (ray + fy) * dt
+
+    # Squared-speed test first; sqrt only where the clamp actually fires
+    v2 = vx * vx + vy * vy
+    fast = v2 > max_speed * max_speed
+    if fast.any():
+        scale = max_speed / np.sqrt(v2[fast])
+        vx[fast] *= scale
+        vy[fast] *= scale
+
+    x += vx * dt
+    y += vy * dt
+
+    # Soft wall collisions (same margin/damping as _clamp_to_bounds)
+    margin = 0.05
+    lo, hi = bounds[0] + margin, bounds[1] - margin
+    below, above = x < lo, x > hi
+    x[below] = lo
+    vx[below] = np.abs(vx[below]) * 0.5
+    x[above] = hi
+    vx[above] = -np.abs(vx[above]) * 0.5
+
+    lo, hi = bounds[2] + margin, bounds[3] - margin
+    below, above = y < lo, y > hi
+    y[below] = lo
+    vy[below] = np.abs(vy[below]) * 0.5
+    y[above] = hi
+    vy[above] = -np.abs(vy[above]) * 0.5
+
 
 class EpidemicSimulation(QObject):
     """
@@ -58,6 +123,16 @@ class EpidemicSimulation(QObject):
     stats_updated = pyqtSignal(dict)
     log_message = pyqtSignal(str)
 
+    # Quarantine zone bounds per mode, hoisted so the per-step path
+    # does not rebuild the tuple every tick
+    Q_BOUNDS_SIMPLE = (-0.95, -0.6, -0.95, -0.6)      # Lower-left corner
+    Q_BOUNDS_COMMUNITIES = (-3, -1, -3, -1)           # Lower-left tile (community 0)
+
+    # Travel destination LUT: row i lists every community except i, so
+    # picking a destination is one batched integer draw plus an index
+    _OTHER_COMMS = tuple(tuple(c for c in range(9) if c != i)
+                         for i in range(9))
+
     def __init__(self, mode='simple'):
         """
         Initialize the epidemic simulation.
@@ -67,11 +142,34 @@ class EpidemicSimulation(QObject):
         """
         super().__init__()
         self.mode = mode
+        # Mode-specialized per-step dispatch, rebound on initialize()
+        # so mode changes via the UI take effect on reset
+        self._step_zones = (self._step_zones_communities
+                            if mode == 'communities'
+                            else self._step_zones_simple)
         self.bounds = (-1, 1, -1, 1)
         self.particles = []
         self.quarantine_particles = []
         self.communities = {}
+        # Contiguous (9, 4) float32 mirror of the community bounds
+        # tuples, built by _init_communities; lets the travel path
+        # fancy-index destination bounds instead of chasing dicts
+        self.comm_bounds = None
         self.spatial_grid = SpatialGrid()
+        # Persistent per-zone grids for the social-distancing path,
+        # keyed by bounds; incrementally updated within a day and
+        # discarded at day boundaries when list membership can change
+        self._sd_grids = {}
+        # Cached concatenation for get_all_particles; None = dirty.
+        # Invalidated on any event that changes list membership.
+        self._all_particles_cache = None
+        # Particles currently at the marketplace, so the daily timer
+        # update touches O(attendees) instead of scanning the population
+        self._marketplace_attendees = []
+        # Live state counts [susceptible, infected, removed], adjusted
+        # incrementally at every state transition so _update_stats is
+        # O(1) instead of recounting the population
+        self._counts = [0, 0, 0]
 
         self.time_count = 0
         self.day_count = 0
@@ -107,6 +205,10 @@ class EpidemicSimulation(QObject):
         self.particles = []
         self.quarantine_particles = []
         self.communities = {}
+        self.comm_bounds = None
+        self._sd_grids = {}
+        self._all_particles_cache = None
+        self._marketplace_attendees = []
         self.time_count = 0
         self.day_count = 0
         self.last_marketplace_day = -params.marketplace_interval  # Reset marketplace
@@ -122,10 +224,19 @@ class EpidemicSimulation(QObject):
         self.log(f"INITIALIZING {self.mode.upper()} SIMULATION...")
 
         if self.mode == 'communities':
+            self._step_zones = self._step_zones_communities
             self._init_communities()
         else:
+            self._step_zones = self._step_zones_simple
             self._init_simple()
 
+        # Seed the incremental state counters with one full count; from
+        # here on they track transitions only
+        all_p = self.get_all_particles()
+        codes = np.fromiter((p.state_code for p in all_p),
+                            np.int8, len(all_p))
+        self._counts = np.bincount(codes, minlength=3).tolist()[:3]
+
         self._update_stats()
 
     def _init_simple(self):
@@ -138,13 +249,23 @@ class EpidemicSimulation(QObject):
         num_infected = max(1, int(params.num_particles * params.fraction_infected_init))
         self.log(f"SPAWNING {params.num_particles} PARTICLES ({num_infected} INFECTED)")
 
-        for i in range(params.num_particles):
-            # UNIFORM DISTRIBUTION: Particle positions randomly distributed
-            # All positions within bounds equally likely - no clustering or bias
-            x = random.uniform(self.bounds[0] + 0.15, self.bounds[1] - 0.15)
-            y = random.uniform(self.bounds[2] + 0.15, self.bounds[3] - 0.15)
-            state = 'infected' if i < num_infected else 'susceptible'
-            self.particles.append(Particle(x, y, state))
+        # Hoist params reads out of the construction loop - one proxy
+        # attribute lookup each instead of one per particle
+        sdo = params.social_distance_obedient
+        pns = params.prob_no_symptoms
+
+        # UNIFORM DISTRIBUTION: Particle positions randomly distributed
+        # All positions within bounds equally likely - no clustering or bias
+        # (one batched draw per axis instead of two RNG calls per particle)
+        n = params.num_particles
+        # .tolist() hands plain Python floats to the scalar attribute math
+        xs = _rng.uniform(self.bounds[0] + 0.15, self.bounds[1] - 0.15, n).tolist()
+        ys = _rng.uniform(self.bounds[2] + 0.15, self.bounds[3] - 0.15, n).tolist()
+        self.particles = [
+            Particle(xs[i], ys[i],
+                     'infected' if i < num_infected else 'susceptible',
+                     _sdo=sdo, _pns=pns)
+            for i in range(n)]
 
         self.initial_population = params.num_particles
 
@@ -167,6 +288,10 @@ class EpidemicSimulation(QObject):
         # Quarantine zone is community 0 (lower-left tile)
         quarantine_comm_id = 0
 
+        # Hoist params reads out of the per-particle loops below
+        sdo = params.social_distance_obedient
+        pns = params.prob_no_symptoms
+
         for i in range(3):
             for j in range(3):
                 comm_id = i * 3 + j
@@ -190,13 +315,23 @@ class EpidemicSimulation(QObject):
 
                 total_infected += num_infected
 
-                for k in range(params.num_per_community):
-                    # UNIFORM DISTRIBUTION: Particle positions within each community
-                    # Ensures equal spatial distribution within community bounds
-                    x = random.uniform(bounds[0] + 0.1, bounds[1] - 0.1)
-                    y = random.uniform(bounds[2] + 0.1, bounds[3] - 0.1)
-                    state = 'infected' if k < num_infected else 'susceptible'
-                    self.communities[comm_id]['particles'].append(Particle(x, y, state))
+                # UNIFORM DISTRIBUTION: Particle positions within each community
+                # Ensures equal spatial distribution within community bounds
+                # (one batched draw per axis per community)
+                n = params.num_per_community
+                xs = _rng.uniform(bounds[0] + 0.1, bounds[1] - 0.1, n).tolist()
+                ys = _rng.uniform(bounds[2] + 0.1, bounds[3] - 0.1, n).tolist()
+                self.communities[comm_id]['particles'] = [
+                    Particle(xs[k], ys[k],
+                             'infected' if k < num_infected else 'susceptible',
+                             _sdo=sdo, _pns=pns)
+                    for k in range(n)]
+
+        # Dense float32 mirror of the bounds tuples, one row per
+        # community, for fancy-indexed lookups in the travel path
+        self.comm_bounds = np.array(
+            [self.communities[c]['bounds'] for c in range(9)],
+            dtype=np.float32)
 
         # Adjust initial population count (8 communities if quarantine enabled, 9 otherwise)
         if params.quarantine_enabled:
@@ -216,12 +351,37 @@ class EpidemicSimulation(QObject):
         Returns:
             list: All active particles (main space + quarantine)
         """
-        if self.mode == 'communities':
-            all_p = []
-            for comm in self.communities.values():
-                all_p.extend(comm['particles'])
-            return all_p + self.quarantine_particles
-        return self.particles + self.quarantine_particles
+        if self._all_particles_cache is None:
+            if self.mode == 'communities':
+                all_p = []
+                for comm in self.communities.values():
+                    all_p.extend(comm['particles'])
+                all_p.extend(self.quarantine_particles)
+            else:
+                all_p = self.particles + self.quarantine_particles
+            self._all_particles_cache = all_p
+        return self._all_particles_cache
+
+    def position_columns(self):
+        """
+        Gather all live particles into SoA mirror columns.
+
+        One fromiter pass per column hands array consumers (the batched
+        screen transform, vectorized kernels) contiguous float32/int8
+        buffers instead of N attribute lookups each. Particle objects
+        stay authoritative; the columns are a per-call view of them in
+        get_all_particles() order.
+
+        Returns:
+            tuple: (particles list, x float32, y float32, state int8 codes)
+        """
+        all_p = self.get_all_particles()
+        n = len(all_p)
+        x = np.fromiter((p.x for p in all_p), np.float32, n)
+        y = np.fromiter((p.y for p in all_p), np.float32, n)
+        codes = np.fromiter((p.state_code for p in all_p),
+                            np.int8, n)
+        return all_p, x, y, codes
 
     def _clamp_to_bounds(self, particle, bounds):
         """
@@ -307,7 +467,8 @@ class EpidemicSimulation(QObject):
                 particle.y = q_ymax + 0.1
                 particle.vy = abs(particle.vy) * 0.8
 
-    def _update_particle_physics(self, particle, bounds, nearby_particles):
+    def _update_particle_physics(self, particle, bounds, nearby_particles,
+                                 rax=None, ray=None, snap=None):
         """
         Update particle position and velocity based on physics simulation.
 
@@ -320,78 +481,199 @@ class EpidemicSimulation(QObject):
             particle (Particle): Particle to update
             bounds (tuple): Boundaries to respect
             nearby_particles (list): Nearby particles for social distancing calculations
+            rax, ray: Pre-drawn random accelerations from a batched draw;
+                falls back to per-call draws when omitted
+            snap (SimSnapshot): Parameter snapshot shared across the
+                step; taken fresh when omitted
         """
+        if snap is None:
+            snap = params.snapshot()
         # CRITICAL FIX: Cancel community travel for quarantined particles
         if particle.quarantined and particle.traveling_between_communities:
             particle.traveling_between_communities = False
+            particle.traveling = (particle.traveling_to_marketplace or
+                                  particle.returning_home)
 
         # Handle marketplace movement first (overrides normal physics)
         self._update_marketplace_movement(particle)
 
         # Skip normal physics if traveling (marketplace or communities)
         # Use overall simulation bounds to allow border crossing
-        if particle.traveling_to_marketplace or particle.returning_home or particle.traveling_between_communities:
+        if particle.traveling:
             particle.x += particle.vx * self.time_step
             particle.y += particle.vy * self.time_step
             self._clamp_to_bounds(particle, self.bounds)  # Use overall bounds for travel
 
             # Check if particle reached destination community
+            # (squared-distance test: 0.1 ** 2, no sqrt needed)
             if particle.traveling_between_communities:
-                dist = math.sqrt((particle.x - particle.target_x)**2 + (particle.y - particle.target_y)**2)
-                if dist < 0.1:  # Arrived
+                d2 = ((particle.x - particle.target_x) ** 2 +
+                      (particle.y - particle.target_y) ** 2)
+                if d2 < 0.01:  # Arrived
                     particle.traveling_between_communities = False
+                    particle.traveling = (particle.traveling_to_marketplace or
+                                          particle.returning_home)
                     particle.vx = random.uniform(-0.2, 0.2)
                     particle.vy = random.uniform(-0.2, 0.2)
             return
 
-        fx, fy = 0, 0
+        # Branchless boundary forces: max(0, 1 - dist/min_dist) is zero
+        # away from the walls, so the four edge terms collapse into two
+        # expressions with no unpredictable branches (same formulation as
+        # the array kernel in _physics_arrays)
         min_dist = 0.15
-
-        dist_left = particle.x - bounds[0]
-        dist_right = bounds[1] - particle.x
-        dist_bottom = particle.y - bounds[2]
-        dist_top = bounds[3] - particle.y
-
-        if dist_left < min_dist:
-            fx += params.boundary_force * (1 - dist_left/min_dist)
-        if dist_right < min_dist:
-            fx -= params.boundary_force * (1 - dist_right/min_dist)
-        if dist_bottom < min_dist:
-            fy += params.boundary_force * (1 - dist_bottom/min_dist)
-        if dist_top < min_dist:
-            fy -= params.boundary_force * (1 - dist_top/min_dist)
-
-        if params.social_distance_factor > 0 and particle.obeys_social_distance:
-            sd_radius = params.infection_radius * params.boxes_to_consider
+        inv_min = 1.0 / min_dist
+        bf = snap.boundary_force
+        fx = bf * (max(0.0, 1.0 - (particle.x - bounds[0]) * inv_min)
+                   - max(0.0, 1.0 - (bounds[1] - particle.x) * inv_min))
+        fy = bf * (max(0.0, 1.0 - (particle.y - bounds[2]) * inv_min)
+                   - max(0.0, 1.0 - (bounds[3] - particle.y) * inv_min))
+
+        if snap.social_distance_factor > 0 and particle.obeys_social_distance:
+            sd_radius = snap.infection_radius * snap.boxes_to_consider
+            # Filter on squared distance; sqrt only for the pairs that
+            # actually exert a force (one per pair instead of one per
+            # candidate, and no redundant (dist + eps) division)
+            sd_r2 = sd_radius * sd_radius
+            sd_factor = snap.social_distance_factor
             for other in nearby_particles:
                 if other is particle:
                     continue
-                dist = particle.distance_to(other)
-                if 0.001 < dist < sd_radius:
-                    force = params.social_distance_factor / (dist ** 2 + 0.01)
-                    dx = particle.x - other.x
-                    dy = particle.y - other.y
-                    fx += force * dx / (dist + 0.001) / 50
-                    fy += force * dy / (dist + 0.001) / 50
-
-        particle.ax = random.uniform(-0.002, 0.002)
-        particle.ay = random.uniform(-0.002, 0.002)
+                dx = particle.x - other.x
+                dy = particle.y - other.y
+                d2 = dx * dx + dy * dy
+                if 1e-6 < d2 < sd_r2:
+                    inv = 1.0 / math.sqrt(d2 + 1e-6)
+                    force = sd_factor / (d2 + 0.01)
+                    fx += force * dx * inv / 50
+                    fy += force * dy * inv / 50
+
+        if rax is None:
+            rax = random.uniform(-0.002, 0.002)
+            ray = random.uniform(-0.002, 0.002)
+        particle.ax = rax
+        particle.ay = ray
 
         particle.vx += (particle.ax + fx) * self.time_step
         particle.vy += (particle.ay + fy) * self.time_step
 
-        speed = math.sqrt(particle.vx**2 + particle.vy**2)
-        max_speed = 0.05 if params.social_distance_factor > 0.3 else params.speed_limit
-        if speed > max_speed:
-            particle.vx *= max_speed / speed
-            particle.vy *= max_speed / speed
+        # Squared-speed test first; sqrt only when the clamp actually
+        # fires (the common case is no clamp)
+        v2 = particle.vx * particle.vx + particle.vy * particle.vy
+        max_speed = 0.05 if snap.social_distance_factor > 0.3 else snap.speed_limit
+        if v2 > max_speed * max_speed:
+            scale = max_speed / math.sqrt(v2)
+            particle.vx *= scale
+            particle.vy *= scale
+
+        # Fused integrate + clamp: positions stay in locals across the
+        # boundary handling instead of a method call re-reading the
+        # attributes just written (same margin/damping as
+        # _clamp_to_bounds, which the travel path still uses)
+        x = particle.x + particle.vx * self.time_step
+        y = particle.y + particle.vy * self.time_step
+        margin = 0.05
 
-        particle.x += particle.vx * self.time_step
-        particle.y += particle.vy * self.time_step
+        lo, hi = bounds[0] + margin, bounds[1] - margin
+        if x < lo:
+            x = lo
+            particle.vx = abs(particle.vx) * 0.5
+        elif x > hi:
+            x = hi
+            particle.vx = -abs(particle.vx) * 0.5
+
+        lo, hi = bounds[2] + margin, bounds[3] - margin
+        if y < lo:
+            y = lo
+            particle.vy = abs(particle.vy) * 0.5
+        elif y > hi:
+            y = hi
+            particle.vy = -abs(particle.vy) * 0.5
+
+        particle.x = x
+        particle.y = y
 
-        self._clamp_to_bounds(particle, bounds)
         self._enforce_quarantine_boundary(particle)
 
+    def _step_physics(self, particle_list, bounds, zone='main'):
+        """
+        Run one physics step for a particle list, picking the fast path.
+
+        With social distancing off (the default for most presets) the
+        non-traveling particles go through the vectorized array kernel;
+        otherwise the per-particle path with spatial-grid neighbor lists
+        is used so the social-distance forces see their neighbors.
+
+        Args:
+            particle_list (list): Particles to update
+            bounds (tuple): Boundaries to respect
+            zone: Stable key identifying the zone (community id or
+                'main'/'quarantine'); each zone keeps its own
+                persistent social-distancing grid
+        """
+        snap = params.snapshot()
+        if snap.social_distance_factor > 0:
+            # Persistent grid per zone: most particles stay in their cell
+            # between consecutive steps, so sync() only moves the few
+            # that crossed a cell edge instead of rebuilding from scratch.
+            # Keyed by zone identity, not bounds - community 0's bounds
+            # compare equal to the quarantine bounds, which would make
+            # two particle lists share (and corrupt) one grid
+            grid = self._sd_grids.get(zone)
+            if grid is None:
+                grid = self._sd_grids[zone] = SpatialGrid()
+            grid.sync(particle_list)
+            boxes_to_consider = snap.boxes_to_consider
+            # Amortize RNG overhead: one batched draw for the whole list
+            # instead of two random.uniform calls per particle
+            n = len(particle_list)
+            rax = _rng.uniform(-0.002, 0.002, n)
+            ray = _rng.uniform(-0.002, 0.002, n)
+            for i, p in enumerate(particle_list):
+                nearby = grid.get_nearby(p.x, p.y, radius=boxes_to_consider)
+                self._update_particle_physics(p, bounds, nearby,
+                                              rax[i], ray[i], snap)
+            return
+
+        # Partition travelers (marketplace/community movement overrides
+        # normal physics) from the batch-updatable majority
+        normal = []
+        for p in particle_list:
+            if p.traveling:
+                self._update_particle_physics(p, bounds, (), snap=snap)
+            else:
+                normal.append(p)
+        if not normal:
+            return
+
+        # float32 columns: half the bytes per pass through the kernel,
+        # twice the SIMD lanes, and well beyond the precision a bounded
+        # 2D space needs
+        n = len(normal)
+        x = np.fromiter((p.x for p in normal), np.float32, n)
+        y = np.fromiter((p.y for p in normal), np.float32, n)
+        vx = np.fromiter((p.vx for p in normal), np.float32, n)
+        vy = np.fromiter((p.vy for p in normal), np.float32, n)
+        rax = (_rng.random(n, dtype=np.float32) - 0.5) * 0.004
+        ray = (_rng.random(n, dtype=np.float32) - 0.5) * 0.004
+
+        _physics_arrays(x, y, vx, vy, rax, ray, bounds,
+                        snap.boundary_force, self.time_step,
+                        snap.speed_limit)
+
+        # .tolist() scatters plain Python floats back onto the objects
+        xs, ys = x.tolist(), y.tolist()
+        vxs, vys = vx.tolist(), vy.tolist()
+        for i, p in enumerate(normal):
+            p.x = xs[i]
+            p.y = ys[i]
+            p.vx = vxs[i]
+            p.vy = vys[i]
+
+        if snap.quarantine_enabled:
+            for p in normal:
+                self._enforce_quarantine_boundary(p)
+
     def _check_infections(self, particle_list):
         """
         Check for new infections using spatial grid for efficiency.
@@ -406,40 +688,87 @@ class EpidemicSimulation(QObject):
         Returns:
             int: Number of new infections this check
         """
-        self.spatial_grid.clear()
+        # Carriers first: zones with zero infected (most of them early
+        # and late in a run) bail out before the susceptible gather, the
+        # SoA mirrors and the grid rebuild below
+        infected_particles = [p for p in particle_list
+                              if p.state_code == STATE_INFECTED]
+        if not infected_particles:
+            return 0
+        susceptible = [p for p in particle_list
+                       if p.state_code == STATE_SUSCEPTIBLE]
+        if not susceptible:
+            return 0
 
-        susceptible = [p for p in particle_list if p.state == 'susceptible']
-        for p in susceptible:
-            self.spatial_grid.insert(p)
+        # Gather the susceptible set into SoA mirror arrays once, then do
+        # all distance math and infection draws as vectorized passes over
+        # contiguous memory instead of per-pair attribute lookups
+        # float32 mirrors: half the bytes streamed per carrier scan, and
+        # well beyond the precision a bounded 2D radius test needs
+        n = len(susceptible)
+        sus_x = np.fromiter((p.x for p in susceptible), np.float32, n)
+        sus_y = np.fromiter((p.y for p in susceptible), np.float32, n)
+        sus_sus = np.fromiter(
+            (p.infection_susceptibility for p in susceptible), np.float32, n)
+        self.spatial_grid.rebuild(sus_x, sus_y)
+
+        # Reorder the mirrors cell-major so each carrier's neighbor
+        # window gathers from (nearly) contiguous memory instead of
+        # jumping around in list order
+        perm = self.spatial_grid.sorted_permutation()
+        sus_x = sus_x[perm]
+        sus_y = sus_y[perm]
+        sus_sus = sus_sus[perm]
+        susceptible = [susceptible[i] for i in perm.tolist()]
+
+        # Hoist parameter reads out of the O(N*k) contact loop via a frozen
+        # snapshot - each params.* read is a global + attribute lookup that
+        # would otherwise repeat per particle pair
+        snap = params.snapshot()
+        r2 = snap.infection_radius_sq
+        boxes_to_consider = snap.boxes_to_consider
+        prob_no_symptoms = snap.prob_no_symptoms
+        # APPLY NORMAL DISTRIBUTION: Infection probability modified by susceptibility
+        # Base probability adjusted by individual's immune response (susceptibility)
+        # Susceptibility from Normal distribution (mean=1.0, std=0.2)
+        # Example: susceptibility=1.2 means 20% more likely to get infected
+        #
+        # CRITICAL FIX: Divide by time_steps_per_day since we now check EVERY step
+        # This maintains the same daily infection rate as before
+        # E.g., 3% daily with 24 steps/day = 0.125% per step
+        per_step_prob = snap.per_step_infection_prob
 
         new_infections = 0
-        infected_particles = [p for p in particle_list if p.state == 'infected']
+        # Tracks who is still susceptible during this pass, so one agent
+        # cannot be infected (and counted) twice in the same check
+        still_susceptible = np.ones(n, dtype=np.bool_)
 
         for inf_p in infected_particles:
-            nearby = self.spatial_grid.get_nearby(inf_p.x, inf_p.y, radius=params.boxes_to_consider)
-            for sus_p in nearby:
-                dist = inf_p.distance_to(sus_p)
-                if dist < params.infection_radius:
-                    # APPLY NORMAL DISTRIBUTION: Infection probability modified by susceptibility
-                    # Base probability adjusted by individual's immune response (susceptibility)
-                    # Susceptibility from Normal distribution (mean=1.0, std=0.2)
-                    # Example: susceptibility=1.2 means 20% more likely to get infected
-                    #
-                    # CRITICAL FIX: Divide by time_steps_per_day since we now check EVERY step
-                    # This maintains the same daily infection rate as before
-                    # E.g., 3% daily with 24 steps/day = 0.125% per step
-                    per_step_prob = params.prob_infection / params.time_steps_per_day
-                    effective_prob = per_step_prob * sus_p.infection_susceptibility
-
-                    if random.random() < effective_prob:
-                        sus_p.state = 'infected'
-                        sus_p.days_infected = 0
-                        inf_p.infection_count += 1
-
-                        if random.random() < params.prob_no_symptoms:
-                            sus_p.shows_symptoms = False
-
-                        new_infections += 1
+            idx = self.spatial_grid.query_point(inf_p.x, inf_p.y,
+                                                radius=boxes_to_consider)
+            if idx.size == 0:
+                continue
+
+            dx = sus_x[idx] - inf_p.x
+            dy = sus_y[idx] - inf_p.y
+            hits = idx[(dx * dx + dy * dy < r2) & still_susceptible[idx]]
+            if hits.size == 0:
+                continue
+
+            # One batched draw for every in-radius contact of this carrier
+            newly = hits[_rng.random(hits.size) < per_step_prob * sus_sus[hits]]
+            for k in newly:
+                sus_p = susceptible[k]
+                sus_p.state_code = STATE_INFECTED
+                sus_p.days_infected = 0
+                if random.random() < prob_no_symptoms:
+                    sus_p.shows_symptoms = False
+            still_susceptible[newly] = False
+            inf_p.infection_count += newly.size
+            new_infections += newly.size
+
+        self._counts[STATE_SUSCEPTIBLE] -= new_infections
+        self._counts[STATE_INFECTED] += new_infections
 
         # NOTE: Logging disabled for per-step infection checking (performance)
         # Infections are logged as totals in daily stats instead
@@ -469,20 +798,34 @@ class EpidemicSimulation(QObject):
         recovered = 0
         died = 0
 
-        for p in particle_list:
+        # One immutable snapshot instead of per-particle params lookups
+        snap = params.snapshot()
+        quarantine_duration = snap.quarantine_duration
+        infection_duration = snap.infection_duration
+        mortality_rate = snap.mortality_rate
+        quarantine_allowed = (snap.quarantine_enabled and
+                              self.day_count >= snap.start_quarantine)
+        quarantine_after = snap.quarantine_after
+
+        # Pre-draw one uniform per particle for the mortality roll; the
+        # few that are consumed come from a single batched call
+        draws = _rng.random(len(particle_list))
+
+        for i, p in enumerate(particle_list):
             # Update quarantine duration for quarantined particles
             if p.quarantined:
                 p.days_in_quarantine += 1
 
                 # Release if duration expired or particle recovered
                 # CRITICAL FIX: Dead particles should NOT be released - they get removed instead
-                duration_expired = (params.quarantine_duration > 0 and
-                                  p.days_in_quarantine >= params.quarantine_duration)
+                duration_expired = (quarantine_duration > 0 and
+                                  p.days_in_quarantine >= quarantine_duration)
 
-                if p.state == 'removed' or (duration_expired and p.state != 'dead'):
+                if (p.state_code == STATE_REMOVED or
+                        (duration_expired and p.state_code != STATE_DEAD)):
                     to_release.append(p)
 
-            if p.state == 'infected':
+            if p.state_code == STATE_INFECTED:
                 p.days_infected += 1
 
                 # APPLY EXPONENTIAL DISTRIBUTION: Recovery time modified by individual variation
@@ -490,46 +833,51 @@ class EpidemicSimulation(QObject):
                 # Modifier from Exponential distribution (scale=1.0, so mean=1.0)
                 # Example: modifier=1.3 means recovery takes 30% longer than average
                 # Exponential models "time until event" - appropriate for disease progression
-                effective_duration = params.infection_duration * p.recovery_time_modifier
+                effective_duration = infection_duration * p.recovery_time_modifier
 
                 if p.days_infected >= effective_duration:
                     # Infection ends - roll for mortality
-                    if random.random() < params.mortality_rate:
+                    if draws[i] < mortality_rate:
                         # Particle dies
-                        p.state = 'dead'
+                        p.state_code = STATE_DEAD
                         to_remove_dead.append(p)
                         died += 1
                     else:
                         # Particle recovers
-                        p.state = 'removed'
+                        p.state_code = STATE_REMOVED
                         recovered += 1
 
-                elif (params.quarantine_enabled and
-                      p.days_infected >= params.quarantine_after and
-                      self.day_count >= params.start_quarantine and
+                elif (quarantine_allowed and
+                      p.days_infected >= quarantine_after and
                       p.shows_symptoms and
                       not p.quarantined):
                     to_quarantine.append(p)
 
+        # Dead agents leave the counted population entirely; deaths are
+        # derived from the population shortfall in _update_stats
+        self._counts[STATE_INFECTED] -= recovered + died
+        self._counts[STATE_REMOVED] += recovered
+
         if recovered > 0:
             self.log(f">> {recovered} RECOVERED")
         if died > 0:
-            self.log(f">> {died} DIED (mortality: {params.mortality_rate*100:.1f}%)")
+            self.log(f">> {died} DIED (mortality: {mortality_rate*100:.1f}%)")
         if len(to_release) > 0:
             self.log(f">> {len(to_release)} RELEASED from quarantine")
 
         return to_quarantine, to_remove_dead, to_release
 
-    def _move_to_quarantine(self, particle, from_list):
+    def _move_to_quarantine(self, particle):
         """
         Move a particle to the quarantine zone.
 
         Repositions the particle to the quarantine area (location depends on mode),
-        disables social distancing behavior, and transfers to quarantine list.
+        disables social distancing behavior, and appends to the quarantine list.
+        The caller drops moved particles from the source list in one filtered
+        pass per batch (O(N) per day instead of O(N) per transfer).
 
         Args:
             particle (Particle): Particle to quarantine
-            from_list (list): Source list to remove particle from
         """
         particle.quarantined = True
         particle.obeys_social_distance = False
@@ -540,6 +888,7 @@ class EpidemicSimulation(QObject):
         particle.at_marketplace = False
         particle.returning_home = False
         particle.traveling_between_communities = False
+        particle.traveling = False
         particle.marketplace_timer = 0
 
         if self.mode == 'communities':
@@ -555,15 +904,17 @@ class EpidemicSimulation(QObject):
         particle.vx = random.uniform(-0.05, 0.05)
         particle.vy = random.uniform(-0.05, 0.05)
 
-        from_list.remove(particle)
         self.quarantine_particles.append(particle)
+        self._all_particles_cache = None
 
     def _release_from_quarantine(self, particle, target_list):
         """
         Release a particle from quarantine back to main population.
 
         Repositions the particle away from quarantine zone, resets quarantine flags,
-        and transfers particle from quarantine list back to target population list.
+        and appends the particle to the target population list. The caller drops
+        released particles from quarantine_particles in one filtered pass per
+        batch, keyed on the cleared quarantined flag.
 
         Args:
             particle (Particle): Particle to release
@@ -599,8 +950,7 @@ class EpidemicSimulation(QObject):
         particle.vx = random.uniform(-0.05, 0.05)
         particle.vy = random.uniform(-0.05, 0.05)
 
-        # Remove from quarantine list
-        self.quarantine_particles.remove(particle)
+        self._all_particles_cache = None
 
     def _get_marketplace_location(self):
         """
@@ -644,7 +994,7 @@ class EpidemicSimulation(QObject):
             self._start_marketplace_gathering(particle_list)
 
         # Update marketplace timers
-        self._update_marketplace_timers(particle_list)
+        self._update_marketplace_timers()
         return 0
 
     def _start_marketplace_gathering(self, particle_list):
@@ -661,13 +1011,18 @@ class EpidemicSimulation(QObject):
         market_x, market_y = self._get_marketplace_location()
 
         attending = 0
-        for p in particle_list:
+        # One batched attendance draw for the whole list instead of a
+        # scalar random.random() per particle
+        draws = _rng.random(len(particle_list))
+        attendance = params.marketplace_attendance
+        for p, r in zip(particle_list, draws):
             if (not p.quarantined and
                 not p.traveling_to_marketplace and
                 not p.at_marketplace and
-                random.random() < params.marketplace_attendance):
+                r < attendance):
 
                 p.traveling_to_marketplace = True
+                p.traveling = True
                 p.marketplace_timer = params.marketplace_duration
                 p.home_x = p.x
                 p.home_y = p.y
@@ -680,25 +1035,32 @@ class EpidemicSimulation(QObject):
             location_desc = "CENTER TILE" if self.mode == 'communities' else "CENTER"
             self.log(f">> MARKETPLACE @ {location_desc}: {attending} TRAVELING")
 
-    def _update_marketplace_timers(self, particle_list):
+    def _update_marketplace_timers(self):
         """
         Update marketplace attendance timers.
 
         Decrements timers for particles at marketplace and initiates return
-        journey when timer expires.
-
-        Args:
-            particle_list (list): Particles to update timers for
+        journey when timer expires. Walks the tracked attendee subset
+        rather than the whole population; entries whose at_marketplace
+        flag was cleared elsewhere (quarantine) drop out on the next pass.
         """
-        for p in particle_list:
-            if p.at_marketplace:
-                p.marketplace_timer -= 1
-                if p.marketplace_timer <= 0:
-                    # Start returning home
-                    p.at_marketplace = False
-                    p.returning_home = True
-                    p.target_x = p.home_x + random.uniform(-0.1, 0.1)
-                    p.target_y = p.home_y + random.uniform(-0.1, 0.1)
+        if not self._marketplace_attendees:
+            return
+        still_there = []
+        for p in self._marketplace_attendees:
+            if not p.at_marketplace or p.state_code == STATE_DEAD:
+                continue  # Stale entry - left via quarantine or died
+            p.marketplace_timer -= 1
+            if p.marketplace_timer <= 0:
+                # Start returning home
+                p.at_marketplace = False
+                p.returning_home = True
+                p.traveling = True
+                p.target_x = p.home_x + random.uniform(-0.1, 0.1)
+                p.target_y = p.home_y + random.uniform(-0.1, 0.1)
+            else:
+                still_there.append(p)
+        self._marketplace_attendees = still_there
 
     def _update_marketplace_movement(self, particle):
         """
@@ -716,40 +1078,69 @@ class EpidemicSimulation(QObject):
             particle.traveling_to_marketplace = False
             particle.at_marketplace = False
             particle.returning_home = False
+            particle.traveling = particle.traveling_between_communities
             return
 
         if particle.traveling_to_marketplace:
             # Move toward marketplace
             dx = particle.target_x - particle.x
             dy = particle.target_y - particle.y
-            dist = math.sqrt(dx*dx + dy*dy)
+            d2 = dx * dx + dy * dy
 
-            if dist < 0.05:  # Arrived
+            # Squared-distance arrival test (0.05 ** 2); the sqrt is
+            # only paid on ticks that still need a velocity renormalize
+            if d2 < 0.0025:  # Arrived
                 particle.traveling_to_marketplace = False
+                particle.traveling = (particle.returning_home or
+                                      particle.traveling_between_communities)
                 particle.at_marketplace = True
+                self._marketplace_attendees.append(particle)
                 particle.vx = random.uniform(-0.02, 0.02)
                 particle.vy = random.uniform(-0.02, 0.02)
             else:
                 # Move at constant speed toward target
-                speed = 0.08
-                particle.vx = (dx / dist) * speed
-                particle.vy = (dy / dist) * speed
+                scale = 0.08 / math.sqrt(d2)
+                particle.vx = dx * scale
+                particle.vy = dy * scale
 
         elif particle.returning_home:
             # Move toward home
             dx = particle.target_x - particle.x
             dy = particle.target_y - particle.y
-            dist = math.sqrt(dx*dx + dy*dy)
+            d2 = dx * dx + dy * dy
 
-            if dist < 0.05:  # Arrived home
+            if d2 < 0.0025:  # Arrived home (0.05 ** 2)
                 particle.returning_home = False
+                particle.traveling = (particle.traveling_to_marketplace or
+                                      particle.traveling_between_communities)
                 particle.vx = random.uniform(-0.02, 0.02)
                 particle.vy = random.uniform(-0.02, 0.02)
             else:
                 # Move at constant speed toward home
-                speed = 0.08
-                particle.vx = (dx / dist) * speed
-                particle.vy = (dy / dist) * speed
+                scale = 0.08 / math.sqrt(d2)
+                particle.vx = dx * scale
+                particle.vy = dy * scale
+
+    def _step_zones_simple(self):
+        """Per-step physics and infection checks for simple mode."""
+        self._step_physics(self.particles, self.bounds)
+        self._check_infections(self.particles)
+
+        if self.quarantine_particles:
+            self._step_physics(self.quarantine_particles,
+                               self.Q_BOUNDS_SIMPLE, zone='quarantine')
+            self._check_infections(self.quarantine_particles)
+
+    def _step_zones_communities(self):
+        """Per-step physics and infection checks for communities mode."""
+        for cid, comm in self.communities.items():
+            self._step_physics(comm['particles'], comm['bounds'], zone=cid)
+            self._check_infections(comm['particles'])
+
+        if self.quarantine_particles:
+            self._step_physics(self.quarantine_particles,
+                               self.Q_BOUNDS_COMMUNITIES, zone='quarantine')
+            self._check_infections(self.quarantine_particles)
 
     def step(self):
         """
@@ -760,55 +1151,9 @@ class EpidemicSimulation(QObject):
         community travel). Emits statistics updates on day boundaries.
         """
         # === PHYSICS UPDATE (Every Step) ===
-        if self.mode == 'communities':
-            for comm in self.communities.values():
-                self.spatial_grid.clear()
-                for p in comm['particles']:
-                    self.spatial_grid.insert(p)
-
-                for p in comm['particles']:
-                    nearby = self.spatial_grid.get_nearby(p.x, p.y, radius=params.boxes_to_consider)
-                    self._update_particle_physics(p, comm['bounds'], nearby)
-
-                # OPTIMIZATION: Reuse spatial grid for infection checking (same particles)
-                self._check_infections(comm['particles'])
-
-            if self.quarantine_particles:
-                # Quarantine zone - build grid once for both physics and infections
-                q_bounds = (-3, -1, -3, -1)  # Lower-left tile (community 0)
-                self.spatial_grid.clear()
-                for p in self.quarantine_particles:
-                    self.spatial_grid.insert(p)
-                for p in self.quarantine_particles:
-                    nearby = self.spatial_grid.get_nearby(p.x, p.y, radius=params.boxes_to_consider)
-                    self._update_particle_physics(p, q_bounds, nearby)
-                # OPTIMIZATION: Reuse spatial grid for infection checking
-                self._check_infections(self.quarantine_particles)
-
-        else:
-            # Simple mode - build grid once for both physics and infections
-            self.spatial_grid.clear()
-            for p in self.particles:
-                self.spatial_grid.insert(p)
-
-            for p in self.particles:
-                nearby = self.spatial_grid.get_nearby(p.x, p.y, radius=params.boxes_to_consider)
-                self._update_particle_physics(p, self.bounds, nearby)
-
-            # OPTIMIZATION: Reuse spatial grid for infection checking
-            self._check_infections(self.particles)
-
-            if self.quarantine_particles:
-                # Quarantine zone - build grid once for both physics and infections
-                q_bounds = (-0.95, -0.6, -0.95, -0.6)  # Lower-left corner
-                self.spatial_grid.clear()
-                for p in self.quarantine_particles:
-                    self.spatial_grid.insert(p)
-                for p in self.quarantine_particles:
-                    nearby = self.spatial_grid.get_nearby(p.x, p.y, radius=params.boxes_to_consider)
-                    self._update_particle_physics(p, q_bounds, nearby)
-                # OPTIMIZATION: Reuse spatial grid for infection checking
-                self._check_infections(self.quarantine_particles)
+        # Bound to the mode-specific method at initialize(), so the
+        # per-tick path pays no mode comparison
+        self._step_zones()
 
         # === DAILY EVENTS (Once Per Day) ===
         if self.time_count % params.time_steps_per_day == 0:
@@ -816,7 +1161,8 @@ class EpidemicSimulation(QObject):
 
             # Log daily infection totals (count current infected)
             all_particles = self.get_all_particles()
-            current_infected = sum(1 for p in all_particles if p.state == 'infected')
+            current_infected = sum(1 for p in all_particles
+                                   if p.state_code == STATE_INFECTED)
             if current_infected > 0:
                 self.log(f">> ACTIVE INFECTIONS: {current_infected}")
 
@@ -831,16 +1177,23 @@ class EpidemicSimulation(QObject):
                     total_released += len(to_release)
 
                     for p in to_q:
-                        self._move_to_quarantine(p, comm['particles'])
+                        self._move_to_quarantine(p)
 
                     # Release particles back to communities (method handles placement)
                     for p in to_release:
                         self._release_from_quarantine(p, None)  # None because method handles community placement
-
-                    # Remove dead particles efficiently (build new list instead of removing)
-                    if to_dead:
-                        to_dead_set = set(to_dead)
-                        comm['particles'] = [p for p in comm['particles'] if p not in to_dead_set]
+                    if to_release:
+                        self.quarantine_particles = [
+                            p for p in self.quarantine_particles
+                            if p.quarantined]
+
+                    # Single fused rebuild drops quarantine movers and
+                    # the dead in one pass over the list
+                    if to_q or to_dead:
+                        comm['particles'] = [
+                            p for p in comm['particles']
+                            if not p.quarantined and p.state_code != STATE_DEAD]
+                        self._all_particles_cache = None
 
                 if self.quarantine_particles:
                     # NOTE: Infection checking moved to every-step section above
@@ -852,10 +1205,13 @@ class EpidemicSimulation(QObject):
                         for p in to_release_q:
                             self._release_from_quarantine(p, None)  # None because method handles community placement
 
-                    # Remove dead particles from quarantine efficiently
-                    if to_dead:
-                        to_dead_set = set(to_dead)
-                        self.quarantine_particles = [p for p in self.quarantine_particles if p not in to_dead_set]
+                    # Single fused rebuild drops released particles and
+                    # the dead in one pass over the quarantine list
+                    if to_release_q or to_dead:
+                        self.quarantine_particles = [
+                            p for p in self.quarantine_particles
+                            if p.quarantined and p.state_code != STATE_DEAD]
+                        self._all_particles_cache = None
 
                 if total_quarantined > 0:
                     self.log(f">> {total_quarantined} MOVED TO QUARANTINE")
@@ -879,17 +1235,23 @@ class EpidemicSimulation(QObject):
                 if to_q:
                     self.log(f">> {len(to_q)} MOVED TO QUARANTINE")
                     for p in to_q:
-                        self._move_to_quarantine(p, self.particles)
+                        self._move_to_quarantine(p)
 
                 # Release particles from quarantine back to main population
                 if to_release:
                     for p in to_release:
                         self._release_from_quarantine(p, self.particles)
-
-                # Remove dead particles efficiently
-                if to_dead:
-                    to_dead_set = set(to_dead)
-                    self.particles = [p for p in self.particles if p not in to_dead_set]
+                    self.quarantine_particles = [
+                        p for p in self.quarantine_particles
+                        if p.quarantined]
+
+                # Single fused rebuild drops quarantine movers and the
+                # dead in one pass over the list
+                if to_q or to_dead:
+                    self.particles = [
+                        p for p in self.particles
+                        if not p.quarantined and p.state_code != STATE_DEAD]
+                    self._all_particles_cache = None
 
                 if self.quarantine_particles:
                     # NOTE: Infection checking moved to every-step section above
@@ -900,14 +1262,21 @@ class EpidemicSimulation(QObject):
                         for p in to_release_q:
                             self._release_from_quarantine(p, self.particles)
 
-                    # Remove dead particles from quarantine efficiently
-                    if to_dead:
-                        to_dead_set = set(to_dead)
-                        self.quarantine_particles = [p for p in self.quarantine_particles if p not in to_dead_set]
+                    # Single fused rebuild drops released particles and
+                    # the dead in one pass over the quarantine list
+                    if to_release_q or to_dead:
+                        self.quarantine_particles = [
+                            p for p in self.quarantine_particles
+                            if p.quarantined and p.state_code != STATE_DEAD]
+                        self._all_particles_cache = None
 
                 # Handle marketplace events (simple/quarantine modes)
                 self._handle_marketplace(self.particles)
 
+            # Daily events can move particles between lists; drop the
+            # persistent social-distancing grids so they resync cleanly
+            self._sd_grids.clear()
+
             self._update_stats()
             self.day_count += 1
 
@@ -925,36 +1294,69 @@ class EpidemicSimulation(QObject):
             int: Number of particles that started traveling
         """
         travelers = 0
+        per_step_prob = params.travel_probability / params.time_steps_per_day
         for comm_id, comm in self.communities.items():
-            to_travel = []
-            for p in comm['particles']:
-                if not p.quarantined and not p.traveling_between_communities and random.random() < params.travel_probability / params.time_steps_per_day:
-                    to_travel.append(p)
-
-            for p in to_travel:
-                other_comms = [c for c in range(9) if c != comm_id]
-                target_comm_id = random.choice(other_comms)
-                target_bounds = self.communities[target_comm_id]['bounds']
+            plist = comm['particles']
+            if not plist:
+                continue
+
+            # One Bernoulli batch per community instead of a scalar
+            # random.random() call per particle
+            draws = _rng.random(len(plist))
+            to_travel = [p for p, r in zip(plist, draws)
+                         if (r < per_step_prob and not p.quarantined and
+                             not p.traveling_between_communities)]
+            if not to_travel:
+                continue
+
+            # Batched destination and unit-target draws; row comm_id of
+            # the LUT holds every community except this one
+            k = len(to_travel)
+            others = self._OTHER_COMMS[comm_id]
+            dest_ids = [others[d] for d in _rng.integers(0, 8, k)]
+            ux = _rng.random(k)
+            uy = _rng.random(k)
+
+            # Targets and travel velocities as whole-array math: fancy
+            # index the destination rows of comm_bounds, scale the unit
+            # draws into them, then one hypot/divide pass replaces a
+            # sqrt per traveler
+            tb = self.comm_bounds[dest_ids]
+            tx = tb[:, 0] + 0.1 + ux * (tb[:, 1] - tb[:, 0] - 0.2)
+            ty = tb[:, 2] + 0.1 + uy * (tb[:, 3] - tb[:, 2] - 0.2)
+            dx = tx - np.fromiter((p.x for p in to_travel), np.float64, k)
+            dy = ty - np.fromiter((p.y for p in to_travel), np.float64, k)
+            speed = 0.15  # Travel speed
+            dist = np.hypot(dx, dy)
+            np.maximum(dist, 1e-12, out=dist)  # Already-at-target guard
+            vxs = (dx * (speed / dist)).tolist()
+            vys = (dy * (speed / dist)).tolist()
+            txl, tyl = tx.tolist(), ty.tolist()
+
+            for i, p in enumerate(to_travel):
+                target_comm_id = dest_ids[i]
 
                 # Set target location in destination community
-                p.target_x = random.uniform(target_bounds[0] + 0.1, target_bounds[1] - 0.1)
-                p.target_y = random.uniform(target_bounds[2] + 0.1, target_bounds[3] - 0.1)
+                p.target_x = txl[i]
+                p.target_y = tyl[i]
                 p.traveling_between_communities = True
+                p.traveling = True
                 p.target_community_id = target_comm_id
 
                 # Set velocity towards target
-                dx = p.target_x - p.x
-                dy = p.target_y - p.y
-                dist = math.sqrt(dx**2 + dy**2)
-                if dist > 0:
-                    speed = 0.15  # Travel speed
-                    p.vx = (dx / dist) * speed
-                    p.vy = (dy / dist) * speed
-
-                # Move particle to destination community list
-                comm['particles'].remove(p)
+                p.vx = vxs[i]
+                p.vy = vys[i]
+
+                # Move particle to its destination community list
                 self.communities[target_comm_id]['particles'].append(p)
-                travelers += 1
+
+            # Drop all departures from the source list in one filtered
+            # pass (identity-set membership) instead of an O(N) scan
+            # per traveler via list.remove
+            moved = set(to_travel)
+            comm['particles'] = [p for p in plist if p not in moved]
+            self._all_particles_cache = None
+            travelers += k
 
         return travelers
 
@@ -976,18 +1378,21 @@ class EpidemicSimulation(QObject):
         if self.initial_population == 0:
             return
 
-        counts = {'susceptible': 0, 'infected': 0, 'removed': 0, 'dead': deaths}
-        for p in all_p:
-            counts[p.state] += 1
+        # Read the incrementally maintained counters - O(transitions)
+        # per day at the transition sites, O(1) here
+        c = self._counts
+        counts = {'susceptible': c[STATE_SUSCEPTIBLE],
+                  'infected': c[STATE_INFECTED],
+                  'removed': c[STATE_REMOVED], 'dead': deaths}
 
         # Calculate percentages based on initial population
-        for state in ['susceptible', 'infected', 'removed']:
-            percent = (counts[state] / self.initial_population) * 100
-            self.stats[state].append(percent)
+        scale = 100.0 / self.initial_population
+        self.stats['susceptible'].append(counts['susceptible'] * scale)
+        self.stats['infected'].append(counts['infected'] * scale)
+        self.stats['removed'].append(counts['removed'] * scale)
 
         # Deaths as percentage of initial population
-        death_percent = (deaths / self.initial_population) * 100
-        self.stats['dead'].append(death_percent)
+        self.stats['dead'].append(deaths * scale)
 
         self.stats['day'].append(self.day_count)
         self.stats_updated.emit(counts)
@@ -4,6 +4,8 @@ Reduces infection checking from O(n²) to O(n) complexity
 """
 from collections import defaultdict
 
+import numpy as np
+
 
 class SpatialGrid:
     """
@@ -22,10 +24,22 @@ class SpatialGrid:
         """
         self.cell_size = cell_size
         self.grid = defaultdict(list)
+        self._count = 0  # Particles currently tracked (see sync)
+
+        # CSR state built by rebuild() for the array-based path
+        self._order = None   # agent indices sorted by cell id (int32)
+        self._bins = None    # per-cell start offsets into _order
+        self._cell_x = None  # per-agent integer cell coordinates
+        self._cell_y = None
+        self._cx_min = 0
+        self._cy_min = 0
+        self._grid_w = 0
+        self._grid_h = 0
 
     def clear(self):
         """Clear all particles from the grid"""
         self.grid.clear()
+        self._count = 0
 
     def _hash(self, x, y):
         """
@@ -48,6 +62,47 @@ class SpatialGrid:
         """
         cell = self._hash(particle.x, particle.y)
         self.grid[cell].append(particle)
+        particle._cell_key = cell
+        self._count += 1
+
+    def update(self, particle):
+        """
+        Move a particle to its current cell if it changed
+
+        O(1) when the particle stayed in its cell - the common case for
+        slow-moving particles across consecutive timesteps.
+
+        Args:
+            particle: Particle object previously insert()-ed
+        """
+        cell = self._hash(particle.x, particle.y)
+        old = particle._cell_key
+        if cell == old:
+            return
+        self.grid[old].remove(particle)
+        self.grid[cell].append(particle)
+        particle._cell_key = cell
+
+    def sync(self, particles):
+        """
+        Bring the grid up to date with a particle list
+
+        Incrementally updates cells when the membership count is
+        unchanged (only movers pay), and falls back to a full rebuild
+        when particles were added or removed. Callers must discard or
+        clear the grid when list membership changes without changing
+        its length.
+
+        Args:
+            particles (list): The particle list this grid tracks
+        """
+        if self._count == len(particles):
+            for p in particles:
+                self.update(p)
+        else:
+            self.clear()
+            for p in particles:
+                self.insert(p)
 
     def get_nearby(self, x, y, radius=1):
         """
@@ -68,3 +123,142 @@ class SpatialGrid:
             for dy in range(-radius, radius + 1):
                 nearby.extend(self.grid.get((cell_x + dx, cell_y + dy), []))
         return nearby
+
+    def rebuild(self, px, py):
+        """
+        Rebuild the grid from position columns as sorted int32 cell indices
+
+        Vectorized counterpart to clear()+insert(): computes every agent's
+        cell id in one pass, argsorts once, and bins the sorted ids with
+        searchsorted. The resulting CSR arrays (one contiguous slice of
+        agent indices per cell) are what the vectorized infection kernels
+        consume - no Python dict or per-agent tuple hashing involved.
+
+        Args:
+            px, py: Position arrays (e.g. ParticleArray.x / .y)
+        """
+        inv = 1.0 / self.cell_size
+        cx = np.floor(px * inv).astype(np.int32)
+        cy = np.floor(py * inv).astype(np.int32)
+
+        # Shift to a dense non-negative index space sized to the data
+        self._cx_min = int(cx.min()) if len(cx) else 0
+        self._cy_min = int(cy.min()) if len(cy) else 0
+        cx -= self._cx_min
+        cy -= self._cy_min
+        self._grid_w = int(cx.max()) + 1 if len(cx) else 0
+        self._grid_h = int(cy.max()) + 1 if len(cy) else 0
+        self._cell_x = cx
+        self._cell_y = cy
+
+        cell = cx + cy * np.int32(self._grid_w)
+        order = np.argsort(cell, kind='stable')
+        n_cells = self._grid_w * self._grid_h
+        self._order = order.astype(np.int32, copy=False)
+        # Histogram + prefix sum gives the per-cell start offsets in one
+        # linear pass - cheaper than binary-searching every cell id
+        bins = np.zeros(n_cells + 1, dtype=np.int32)
+        np.cumsum(np.bincount(cell, minlength=n_cells),
+                  out=bins[1:], dtype=np.int32)
+        self._bins = bins
+
+    def sorted_permutation(self):
+        """
+        Switch the CSR table to cell-sorted identity indexing
+
+        Returns the cell-major agent order and rewrites the internal
+        state so that indices returned by subsequent queries refer to
+        positions in that order. Callers that permute their column
+        arrays by the returned order get neighbor windows that are
+        ascending, nearly contiguous index runs, so the per-query
+        gathers walk memory sequentially instead of hopping in
+        insertion order.
+
+        Requires a prior rebuild().
+
+        Returns:
+            np.ndarray: int32 permutation; row i of the sorted columns
+            should be row perm[i] of the originals
+        """
+        perm = self._order
+        self._cell_x = self._cell_x[perm]
+        self._cell_y = self._cell_y[perm]
+        self._order = np.arange(len(perm), dtype=np.int32)
+        return perm
+
+    def neighbors_of(self, i, radius=1):
+        """
+        Get indices of agents in the cells around agent i's cell
+
+        Requires a prior rebuild(). Gathers the CSR slices of the
+        (2*radius+1)^2 surrounding cells.
+
+        Args:
+            i: Agent index
+            radius: Number of cells to search in each direction
+
+        Returns:
+            np.ndarray: int32 agent indices (includes i itself)
+        """
+        return self._gather_window(int(self._cell_x[i]),
+                                   int(self._cell_y[i]), int(radius))
+
+    def query_point(self, x, y, radius=1):
+        """
+        Get indices of agents in the cells around an arbitrary point
+
+        Requires a prior rebuild(). Unlike neighbors_of(), the query
+        point does not have to be one of the rebuilt agents.
+
+        Args:
+            x, y: Query position
+            radius: Number of cells to search in each direction
+
+        Returns:
+            np.ndarray: int32 indices into the rebuilt position arrays
+        """
+        cx = int(np.floor(x / self.cell_size)) - self._cx_min
+        cy = int(np.floor(y / self.cell_size)) - self._cy_min
+        return self._gather_window(cx, cy, int(radius))
+
+    def _gather_window(self, cx, cy, radius):
+        """Collect CSR slices for the cell window around (cx, cy)."""
+        x_lo, x_hi = max(cx - radius, 0), min(cx + radius, self._grid_w - 1)
+        y_lo, y_hi = max(cy - radius, 0), min(cy + radius, self._grid_h - 1)
+        if x_lo > x_hi or y_lo > y_hi:
+            return np.empty(0, dtype=np.int32)
+
+        parts = []
+        bins = self._bins
+        order = self._order
+        for gy in range(y_lo, y_hi + 1):
+            row = gy * self._grid_w
+            # Cells in one grid row are contiguous in cell-id space, so
+            # the whole x-span is a single CSR slice
+            parts.append(order[bins[row + x_lo]:bins[row + x_hi + 1]])
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def csr_neighbors(self, radius=1):
+        """
+        Build flat neighbor_idx/neighbor_off arrays for every agent
+
+        Requires a prior rebuild(). The output format feeds directly into
+        the try_infect kernel: candidates for agent i live in
+        neighbor_idx[neighbor_off[i]:neighbor_off[i+1]].
+
+        Args:
+            radius: Number of cells to search in each direction
+
+        Returns:
+            tuple: (neighbor_idx int32 array, neighbor_off int64 array
+            of length n+1)
+        """
+        n = len(self._cell_x)
+        lists = [self.neighbors_of(i, radius) for i in range(n)]
+        neighbor_off = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(l) for l in lists], out=neighbor_off[1:])
+        neighbor_idx = (np.concatenate(lists) if lists
+                        else np.empty(0, dtype=np.int32))
+        return neighbor_idx, neighbor_off
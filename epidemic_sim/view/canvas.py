@@ -5,11 +5,18 @@ This module contains the SimulationCanvas class which handles all visual renderi
 of the simulation state including particles, boundaries, communities, and special zones.
 """
 
+import time
+
+import numpy as np
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
+from PyQt5.QtCore import Qt, QPoint, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPolygon, QPixmap
 
-from epidemic_sim.view.theme import get_color, NEON_GREEN, BORDER_GREEN
+from epidemic_sim.config.parameters import params
+from epidemic_sim.model.particle import (STATE_SUSCEPTIBLE, STATE_INFECTED,
+                                         STATE_REMOVED)
+from epidemic_sim.view import theme
+from epidemic_sim.view.theme import get_color
 
 
 class SimulationCanvas(QWidget):
@@ -42,6 +49,54 @@ class SimulationCanvas(QWidget):
         super().__init__()
         self.sim = sim
         self.setMinimumSize(900, 900)
+        # Pens/brushes built once per theme (see _styles); repainting
+        # at frame rate must not construct Qt objects per call
+        self._style_cache = None
+        self._style_theme = None
+        # Rasterized static background (boundaries and zones), reused
+        # across frames until size, mode, theme or zone params change
+        self._bg_cache = None
+        self._bg_key = None
+        # Duration of the most recent paint, read by the window's
+        # adaptive frame-skip controller
+        self.last_paint_time = 0.0
+
+    def _styles(self):
+        """
+        Return the cached pen/brush/color table for the current theme.
+
+        Rebuilt only when the active theme object changes, so draw
+        methods reuse the same QPen/QBrush instances every frame
+        instead of constructing them per call.
+
+        Returns:
+            dict: Named QPen/QBrush/QColor instances
+        """
+        if (self._style_cache is None or
+                self._style_theme is not theme.current_theme):
+            orange = QColor("#ffaa00")
+            red = QColor("#ff0000")
+            self._style_cache = {
+                'canvas_bg': QColor(get_color('CANVAS_BG')),
+                'boundary_pen': QPen(QColor(theme.NEON_GREEN), 3),
+                'comm_border_pen': QPen(QColor(theme.BORDER_GREEN), 2),
+                'marketplace_zone_pen': QPen(orange, 2, Qt.DashLine),
+                'marketplace_border_pen': QPen(orange, 3),
+                'marketplace_fill': QBrush(QColor(255, 170, 0, 30)),
+                'marketplace_tile_fill': QBrush(QColor(255, 170, 0, 20)),
+                'quarantine_pen': QPen(red, 3),
+                'quarantine_pen_thick': QPen(red, 4),
+                'quarantine_fill': QBrush(QColor(255, 0, 0, 20)),
+                'quarantine_fill_comm': QBrush(QColor(255, 0, 0, 30)),
+                'radius_ring_pen': QPen(QColor(255, 0, 0, 100), 1),
+                'radius_ring_fill': QBrush(QColor(255, 0, 0, 30)),
+                'susceptible': QColor(*get_color('PARTICLE_SUSCEPTIBLE')),
+                'infected_symp': QColor(*get_color('PARTICLE_INFECTED_SYMP')),
+                'infected_asymp': QColor(*get_color('PARTICLE_INFECTED_ASYMP')),
+                'removed': QColor(*get_color('PARTICLE_REMOVED')),
+            }
+            self._style_theme = theme.current_theme
+        return self._style_cache
 
     def paintEvent(self, event):
         """
@@ -54,23 +109,56 @@ class SimulationCanvas(QWidget):
         Args:
             event: QPaintEvent from Qt framework
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Use theme-aware background color
-        canvas_bg = get_color('CANVAS_BG')
-        painter.fillRect(self.rect(), QColor(canvas_bg))
-
+        t0 = time.perf_counter()
         w = self.width()
         h = self.height()
         self.scale = min(w, h) / 2.2
         self.offset_x = w / 2
         self.offset_y = h / 2
 
-        if self.sim.mode == 'communities':
-            self._draw_communities(painter)
-        else:
-            self._draw_simple(painter)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Static geometry comes from the cached pixmap; only the
+        # particles are rasterized per frame
+        painter.drawPixmap(0, 0, self._background(w, h))
+        self._draw_particles_batch(painter)
+        self.last_paint_time = time.perf_counter() - t0
+
+    def _background(self, w, h):
+        """
+        Return the cached background pixmap, rebuilding when stale.
+
+        The boundaries, community tiles and marketplace/quarantine
+        zones are identical between frames, so they are rasterized once
+        into a pixmap and blitted per paint - the per-frame CPU cost
+        then scales with the moving particles only. The cache key
+        covers everything the background depends on: widget size, mode,
+        active theme and the zone toggles/positions.
+
+        Args:
+            w, h: Current widget size in pixels
+
+        Returns:
+            QPixmap: Fully drawn background at (w, h)
+        """
+        key = (w, h, self.sim.mode, id(theme.current_theme),
+               params.marketplace_enabled, params.marketplace_x,
+               params.marketplace_y, params.marketplace_community_id,
+               params.quarantine_enabled)
+        if key != self._bg_key:
+            pix = QPixmap(w, h)
+            painter = QPainter(pix)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.fillRect(0, 0, w, h, self._styles()['canvas_bg'])
+            if self.sim.mode == 'communities':
+                self._draw_communities(painter)
+            else:
+                self._draw_simple(painter)
+            painter.end()
+            self._bg_cache = pix
+            self._bg_key = key
+        return self._bg_cache
 
     def _to_screen(self, x, y):
         """
@@ -98,36 +186,33 @@ class SimulationCanvas(QWidget):
 
     def _draw_simple(self, painter):
         """
-        Draw the simulation in simple (single boundary) mode.
+        Draw the static background for simple (single boundary) mode.
 
         Renders:
         - Main boundary box in neon green
-        - All active particles
         - Marketplace zone (if enabled)
-        - Quarantine zone and quarantined particles (if enabled)
+        - Quarantine zone (if enabled)
+
+        Particles are drawn separately each frame on top of the cached
+        background (see _background).
 
         Args:
             painter (QPainter): Qt painter object for drawing
         """
-        # Local import to avoid circular dependency
-        import epidemic_sim3
-        params = epidemic_sim3.params
 
+        styles = self._styles()
         tl = self._to_screen(-1, 1)
         br = self._to_screen(1, -1)
-        painter.setPen(QPen(QColor(NEON_GREEN), 3))
+        painter.setPen(styles['boundary_pen'])
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(tl[0], tl[1], br[0] - tl[0], br[1] - tl[1])
 
-        for p in self.sim.particles:
-            self._draw_particle(painter, p)
-
         # Draw marketplace zone if enabled
         if params.marketplace_enabled:
             center = self._to_screen(params.marketplace_x, params.marketplace_y)
             radius = int(0.25 * self.scale)  # Marketplace zone radius
-            painter.setPen(QPen(QColor("#ffaa00"), 2, Qt.DashLine))
-            painter.setBrush(QBrush(QColor(255, 170, 0, 30)))
+            painter.setPen(styles['marketplace_zone_pen'])
+            painter.setBrush(styles['marketplace_fill'])
             painter.drawEllipse(center[0] - radius, center[1] - radius, radius * 2, radius * 2)
 
         # Draw quarantine zone if enabled (always visible when enabled)
@@ -135,31 +220,27 @@ class SimulationCanvas(QWidget):
             # Quarantine box (lower-left corner)
             tl = self._to_screen(-0.95, -0.6)
             br = self._to_screen(-0.6, -0.95)
-            painter.setPen(QPen(QColor("#ff0000"), 3))
-            painter.setBrush(QBrush(QColor(255, 0, 0, 20)))  # Semi-transparent red fill
+            painter.setPen(styles['quarantine_pen'])
+            painter.setBrush(styles['quarantine_fill'])  # Semi-transparent red fill
             painter.drawRect(tl[0], tl[1], br[0] - tl[0], br[1] - tl[1])
 
-            # Draw quarantined particles if any
-            for p in self.sim.quarantine_particles:
-                self._draw_particle(painter, p)
-
     def _draw_communities(self, painter):
         """
-        Draw the simulation in communities (grid) mode.
+        Draw the static background for communities (grid) mode.
 
         Renders:
         - All community boundaries
-        - Particles within each community
         - Special highlighting for marketplace community (if enabled)
-        - Quarantine zone and quarantined particles (if enabled)
+        - Quarantine zone (if enabled)
+
+        Particles are drawn separately each frame on top of the cached
+        background (see _background).
 
         Args:
             painter (QPainter): Qt painter object for drawing
         """
-        # Local import to avoid circular dependency
-        import epidemic_sim3
-        params = epidemic_sim3.params
 
+        styles = self._styles()
         for comm_id, comm in self.sim.communities.items():
             bounds = comm['bounds']
             tl = self._to_screen(bounds[0], bounds[3])
@@ -167,32 +248,106 @@ class SimulationCanvas(QWidget):
 
             # Highlight center tile (marketplace) if marketplace enabled
             if params.marketplace_enabled and comm_id == params.marketplace_community_id:
-                painter.setPen(QPen(QColor("#ffaa00"), 3))  # Orange for marketplace
-                painter.setBrush(QBrush(QColor(255, 170, 0, 20)))  # Semi-transparent fill
+                painter.setPen(styles['marketplace_border_pen'])
+                painter.setBrush(styles['marketplace_tile_fill'])
             else:
-                painter.setPen(QPen(QColor(BORDER_GREEN), 2))
+                painter.setPen(styles['comm_border_pen'])
                 painter.setBrush(Qt.NoBrush)
 
             painter.drawRect(tl[0], tl[1], br[0] - tl[0], br[1] - tl[1])
 
-            for p in comm['particles']:
-                self._draw_particle(painter, p)
-
         # Draw quarantine zone if enabled (always visible when enabled)
         if params.quarantine_enabled:
             # Quarantine zone: Lower-left tile (community 0)
             # Highlight with red border and fill
             tl = self._to_screen(-2.9, -1.1)
             br = self._to_screen(-1.1, -2.9)
-            painter.setPen(QPen(QColor("#ff0000"), 4))  # Thicker red border
-            painter.setBrush(QBrush(QColor(255, 0, 0, 30)))  # Semi-transparent red fill
+            painter.setPen(styles['quarantine_pen_thick'])
+            painter.setBrush(styles['quarantine_fill_comm'])
             painter.drawRect(tl[0], tl[1], br[0] - tl[0], br[1] - tl[1])
 
-            # Draw quarantined particles if any
-            for p in self.sim.quarantine_particles:
-                self._draw_particle(painter, p)
+    def _draw_particles_batch(self, painter):
+        """
+        Draw every live particle using one vectorized screen transform.
+
+        Gathers the SoA position columns from the simulation, maps
+        them to pixel coordinates in two NumPy multiply-adds, and
+        draws in color-bucketed groups so brush/pen state is set once
+        per state rather than once per particle. Sub-slider particle
+        sizes collapse each group into a single drawPoints call.
+
+        Args:
+            painter (QPainter): Qt painter object for drawing
+        """
+
+        all_p, x, y, codes = self.sim.position_columns()
+        if not all_p:
+            return
+
+        scale = self.scale / 3.5 if self.sim.mode == 'communities' else self.scale
+        sxa = self.offset_x + x * scale
+        sya = self.offset_y - y * scale
+        sxl = sxa.tolist()
+        syl = sya.tolist()
+        # One QPointF center per particle, shared by the ring pass and
+        # every color group; the center+radius drawEllipse overload
+        # marshals two args instead of four and keeps sub-pixel
+        # positioning consistent with the antialiasing hint
+        centers = [QPointF(a, b) for a, b in zip(sxl, syl)]
+
+        # Cull anything whose dot (or radius ring) cannot touch the
+        # widget rect - resized-down windows and zoomed layouts stop
+        # paying Qt calls for invisible geometry
+        r = params.infection_radius * self.scale
+        pad = max(params.particle_size,
+                  r if params.show_infection_radius else 0.0)
+        vis = ((sxa >= -pad) & (sxa < self.width() + pad) &
+               (sya >= -pad) & (sya < self.height() + pad))
+
+        inf_idx = np.nonzero((codes == STATE_INFECTED) & vis)[0].tolist()
+
+        styles = self._styles()
+
+        # Infection radius rings first, so the dots paint on top
+        if params.show_infection_radius and inf_idx:
+            painter.setPen(styles['radius_ring_pen'])
+            painter.setBrush(styles['radius_ring_fill'])
+            for i in inf_idx:
+                painter.drawEllipse(centers[i], r, r)
+
+        # Bucket indices by color so brush state is set once per group
+        # instead of once per particle (Qt state changes and FFI
+        # crossings drop from O(N) to O(colors))
+        groups = [
+            (np.nonzero((codes == STATE_SUSCEPTIBLE) & vis)[0].tolist(),
+             styles['susceptible']),
+            ([i for i in inf_idx if all_p[i].shows_symptoms],
+             styles['infected_symp']),
+            ([i for i in inf_idx if not all_p[i].shows_symptoms],
+             styles['infected_asymp']),
+            (np.nonzero((codes == STATE_REMOVED) & vis)[0].tolist(),
+             styles['removed']),
+        ]
+
+        size = params.particle_size
+        half = size / 2
+        painter.setPen(Qt.NoPen)
+        for idx, color in groups:
+            if not idx:
+                continue
+            painter.setBrush(color)
+            if size <= 2:
+                # Tiny dots: one drawPoints call per color group
+                painter.setPen(QPen(color, max(size, 1)))
+                painter.drawPoints(
+                    QPolygon([QPoint(int(sxl[i]), int(syl[i]))
+                              for i in idx]))
+                painter.setPen(Qt.NoPen)
+            else:
+                for i in idx:
+                    painter.drawEllipse(centers[i], half, half)
 
-    def _draw_particle(self, painter, p):
+    def _draw_particle(self, painter, p, sx=None, sy=None):
         """
         Draw a single particle (individual) on the canvas.
 
@@ -208,14 +363,13 @@ class SimulationCanvas(QWidget):
         Args:
             painter (QPainter): Qt painter object for drawing
             p (Particle): The particle object to draw
+            sx, sy: Pre-transformed screen coordinates from the batched
+                pass; computed via _to_screen when omitted
         """
-        # Local import to avoid circular dependency
-        import epidemic_sim3
-        params = epidemic_sim3.params
-        pos = self._to_screen(p.x, p.y)
+        pos = (sx, sy) if sx is not None else self._to_screen(p.x, p.y)
 
         # Draw infection radius circle if enabled and particle is infected
-        if params.show_infection_radius and p.state == 'infected':
+        if params.show_infection_radius and p.state_code == STATE_INFECTED:
             radius_world = params.infection_radius
             radius_screen = int(radius_world * self.scale)
             # Semi-transparent red circle
@@ -225,10 +379,10 @@ class SimulationCanvas(QWidget):
                               radius_screen * 2, radius_screen * 2)
 
         # Use theme-aware colors for particles
-        if p.state == 'susceptible':
+        if p.state_code == STATE_SUSCEPTIBLE:
             rgb = get_color('PARTICLE_SUSCEPTIBLE')
             color = QColor(rgb[0], rgb[1], rgb[2])
-        elif p.state == 'infected':
+        elif p.state_code == STATE_INFECTED:
             if not p.shows_symptoms:
                 rgb = get_color('PARTICLE_INFECTED_ASYMP')
                 color = QColor(rgb[0], rgb[1], rgb[2])
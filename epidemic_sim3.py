@@ -23,7 +23,7 @@ from PyQt5.QtGui import QFont
 
 # Import from modular structure
 from epidemic_sim.view.main_window import EpidemicApp
-from epidemic_sim.config.parameters import params
+from epidemic_sim.config.parameters import SimParams, params
 from epidemic_sim.config.presets import PRESETS
 from epidemic_sim.model.simulation import EpidemicSimulation
 from epidemic_sim.model.particle import Particle
@@ -35,11 +35,6 @@ from epidemic_sim.view.theme import (
     update_legacy_colors, NEON_GREEN, BG_BLACK, PANEL_BLACK, BORDER_GREEN
 )
 
-# Legacy compatibility: Keep old imports working
-# These are no longer defined here but imported from the modular structure
-SimParams = type(params)  # For backward compatibility if anyone imports SimParams
-
-
 # =================== LEGACY ENTRY POINT ===================
 # All implementation has been moved to the modular structure.
 # This file now only provides the entry point for backward compatibility.